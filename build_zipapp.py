@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+KPI Processor Zipapp Builder
+============================
+
+Bundles kpi_processor.py and the scripts/ modules into a single executable archive.
+Each module is stored with precompiled bytecode, so a cold start imports from one file
+without compiling anything:
+
+    python build_zipapp.py
+    python dist/kpi.pyz --mode baseline
+"""
+
+import argparse
+import py_compile
+import shutil
+import sys
+import tempfile
+import zipapp
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent
+ENTRY_MODULE = 'kpi_processor'
+
+MAIN_SOURCE = f"""import sys
+from {ENTRY_MODULE} import main
+
+sys.exit(main())
+"""
+
+def compile_module(path: Path, name: str):
+    """Write <module>.pyc next to path; zipimport uses hash-based, unchecked bytecode as is"""
+    py_compile.compile(
+        str(path),
+        cfile=str(path.with_suffix('.pyc')),
+        dfile=name,
+        doraise=True,
+        invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH
+    )
+
+def build(output: Path, interpreter: str = '/usr/bin/env python3') -> Path:
+    """Build the zipapp at output and return its path"""
+    modules = [f'{ENTRY_MODULE}.py']
+    # kpi_processor adds <archive>/scripts to sys.path, which zipimport resolves inside the archive
+    modules.extend(f'scripts/{script.name}' for script in sorted((PROJECT_ROOT / 'scripts').glob('*.py')))
+    
+    with tempfile.TemporaryDirectory() as staging:
+        staging_dir = Path(staging)
+        
+        for name in modules:
+            target = staging_dir / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(PROJECT_ROOT / name, target)
+            compile_module(target, name)
+        
+        (staging_dir / '__main__.py').write_text(MAIN_SOURCE, encoding='utf-8')
+        compile_module(staging_dir / '__main__.py', '__main__.py')
+        
+        output.parent.mkdir(parents=True, exist_ok=True)
+        zipapp.create_archive(staging_dir, target=output, interpreter=interpreter, compressed=True)
+    
+    return output
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the KPI processor as a single zipapp')
+    parser.add_argument('--output', default='dist/kpi.pyz', help='Archive to create')
+    parser.add_argument('--python', default='/usr/bin/env python3', help='Interpreter line for the archive')
+    args = parser.parse_args()
+    
+    try:
+        archive = build(Path(args.output), args.python)
+    except (OSError, py_compile.PyCompileError) as e:
+        print(f"❌ Build failed: {e}")
+        return 1
+    
+    print(f"✅ Built {archive} ({archive.stat().st_size / 1024:.1f} KB)")
+    print(f"   Run it from the project directory: python {archive} --mode baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
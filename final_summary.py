@@ -13,12 +13,132 @@ Generates comprehensive summaries of the KPI processing system including:
 
 import json
 import os
+import heapq
 import sys
+import tempfile
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Union
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, cached_property
 import glob
-import yaml
+
+# Add scripts directory to path for the shared helpers
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+from yaml_cache import load_yaml_cached
+
+# Upper bound on threads used to read result files concurrently
+JSON_READ_WORKERS = 8
+
+# Result files above this size are streamed with ijson when only a few top-level fields are needed
+STREAM_JSON_MIN_BYTES = 64 * 1024
+
+# Result file name fragments per result type, lowercased for matching against lowercased names
+_RESULT_TYPES = {
+    'baseline': ('baseline_results.json', 'quick_results.json'),
+    'incremental': ('incremental_results.json',),
+    'targeted': ('targeted_', 'sm001_', 'sm004_'),
+    'test': ('test_', 'validation_')
+}
+
+# Sort rank per recommendation priority; unknown priorities sort last
+_PRIORITY_RANK = {'High': 1, 'Medium': 2, 'Low': 3}
+
+# Top-level result fields used by the processing history
+HISTORY_FIELDS = frozenset({'mode', 'records_processed', 'processing_time', 'overall_score'})
+
+# Most recently used entries kept in cache_dir/summary_cache.json between runs
+RESULT_CACHE_MAX_ENTRIES = 500
+
+# Display icons per status value, built once instead of per rendered line
+_HEALTH_ICONS = {"Healthy": "✅", "Needs Attention": "⚠️", "Critical Issues": "🚨"}
+_KPI_STATUS_ICONS = {"Target Met": "✅", "Above Target": "⚠️", "Below Target": "❌",
+                     "Needs Improvement": "⚠️", "Critical": "🚨"}
+_TREND_ICONS = {"improving": "📈", "declining": "📉", "stable": "➡️"}
+_PRIORITY_ICONS = {"High": "🔴", "Medium": "🟡", "Low": "🟢"}
+
+# Fixed console text, assembled once at import and written with a single call each
+SEPARATOR = "=" * 80
+SECTION_RULE = "-" * 60
+BANNER = f"🚀 KPI Processing System - Final Summary Generator\n{SEPARATOR}\n"
+ANALYSIS_HEADER = f"🔍 Analyzing KPI Processing System...\n{SEPARATOR}\n"
+SUMMARY_HEADER = f"\n{SEPARATOR}\n                          FINAL SYSTEM SUMMARY\n{SEPARATOR}"
+SUMMARY_FOOTER = (f"{SEPARATOR}\n"
+                  "💡 TIP: Run individual components from the main menu to address any issues\n"
+                  "📧 Contact IT Service Management Team for additional support\n"
+                  f"{SEPARATOR}")
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is used instead
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; large result files are then parsed whole
+    ijson = None
+
+@lru_cache(maxsize=256)
+def _format_timestamp(seconds: int) -> str:
+    """Format a POSIX timestamp as local 'YYYY-MM-DD HH:MM:SS'"""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(seconds))
+
+def _read_json(path: Union[str, Path]) -> Any:
+    """Read and parse a JSON file"""
+    with open(path, 'rb') as f:
+        return _parse_json(f.read())
+
+def _parse_json(raw: bytes) -> Any:
+    """Parse JSON bytes, with orjson when available and the stdlib parser for anything it rejects (e.g. NaN)"""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+def _read_json_fields(path: Union[str, Path], fields: frozenset) -> Any:
+    """Read only the given top-level keys of a large JSON object; small files and non-objects are parsed whole"""
+    if ijson is None or os.path.getsize(path) <= STREAM_JSON_MIN_BYTES:
+        return _read_json(path)
+    
+    with open(path, 'rb') as f:
+        events = ijson.parse(f, use_float=True)
+        first = next(events, None)
+        if first is None or first[:2] != ('', 'start_map'):
+            return _read_json(path)
+        
+        builders = {}
+        builder = None
+        for prefix, event, value in events:
+            if prefix == '':
+                if event != 'map_key':
+                    continue
+                # Reaching the next top-level key means every wanted field is complete
+                if len(builders) == len(fields):
+                    break
+                builder = None
+                if value in fields:
+                    builder = builders[value] = ijson.ObjectBuilder()
+            elif builder is not None:
+                builder.event(event, value)
+    
+    return {key: builder.value for key, builder in builders.items()}
+
+def _read_json_files(paths: List[str], fields: Optional[frozenset] = None) -> List[Tuple[Any, Optional[Exception]]]:
+    """Read several JSON files on a thread pool, returning (data, error) pairs in input order"""
+    def read_one(path: str) -> Tuple[Any, Optional[Exception]]:
+        try:
+            return (_read_json(path) if fields is None else _read_json_fields(path, fields)), None
+        except Exception as e:
+            return None, e
+    
+    if len(paths) <= 1:
+        return [read_one(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(JSON_READ_WORKERS, len(paths))) as executor:
+        return list(executor.map(read_one, paths))
 
 class FinalSummaryGenerator:
     """Generate comprehensive system summary reports"""
@@ -35,11 +155,118 @@ class FinalSummaryGenerator:
         self.config_analysis = {}
         self.performance_trends = {}
         self.recommendations = []
+        
+        # stat() results and the parsed main configuration, shared by all analyzers within one summary run
+        self._stat_cache: Dict[Union[str, Path], os.stat_result] = {}
+        self._main_config: Optional[Dict[str, Any]] = None
+        
+        # Display-ready fields of the latest overall result, kept out of the saved report
+        self._latest_overview: Optional[Dict[str, Any]] = None
+        
+        # History fields of result files, keyed "path:mtime_ns:size" and persisted across runs
+        self._result_cache: Dict[str, Dict[str, Any]] = {}
+    
+    def _stat(self, path: Union[str, Path]) -> os.stat_result:
+        """Return os.stat(path), reusing the result from earlier in this run"""
+        st = self._stat_cache.get(path)
+        if st is None:
+            st = os.stat(path)
+            self._stat_cache[path] = st
+        return st
+    
+    def _load_main_config(self) -> Dict[str, Any]:
+        """Load kpi_config.yaml once per run"""
+        if self._main_config is None:
+            self._main_config = load_yaml_cached(self.config_dir / "kpi_config.yaml", self.cache_dir)
+        return self._main_config
+    
+    def _scan(self, directory: Path, suffix: str = '') -> List[str]:
+        """List paths (as plain strings) of directory entries ending in suffix, caching each entry's stat()"""
+        paths = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # normcase folds case on Windows, where the glob patterns this replaces ignore it
+                    if not os.path.normcase(entry.name).endswith(suffix):
+                        continue
+                    path = entry.path
+                    try:
+                        self._stat_cache[path] = entry.stat()
+                    except OSError:  # broken symlink; left for _stat() to report
+                        pass
+                    paths.append(path)
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        return paths
+    
+    def _load_result_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load the cross-run result cache, starting empty if it is missing or unreadable"""
+        try:
+            cache = _read_json(self.cache_dir / "summary_cache.json")
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+    
+    def _save_result_cache(self):
+        """Write back the most recently used result cache entries"""
+        if not self.cache_dir.is_dir():
+            return
+        entries = list(self._result_cache.items())[-RESULT_CACHE_MAX_ENTRIES:]
+        try:
+            payload = json.dumps(dict(entries))
+        except (TypeError, ValueError):
+            return
+        
+        try:
+            # Write to a temporary file and rename it, so an interrupted run leaves the previous cache intact
+            with tempfile.NamedTemporaryFile('w', dir=self.cache_dir, suffix='.tmp', delete=False) as f:
+                f.write(payload)
+            try:
+                os.replace(f.name, self.cache_dir / "summary_cache.json")
+            except OSError:
+                os.unlink(f.name)
+        except OSError:
+            pass
+    
+    def _read_history_fields(self, paths: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Return the history fields of each result file (None if unreadable), parsing only files not cached"""
+        keys = []
+        for path in paths:
+            st = self._stat(path)
+            keys.append(f"{os.path.abspath(path)}:{st.st_mtime_ns}:{st.st_size}")
+        
+        missing = [(path, key) for path, key in zip(paths, keys) if key not in self._result_cache]
+        loaded = _read_json_files([path for path, _ in missing], HISTORY_FIELDS)
+        for (path, key), (data, error) in zip(missing, loaded):
+            if error is None and isinstance(data, dict):
+                self._result_cache[key] = {field: data[field] for field in HISTORY_FIELDS if field in data}
+        
+        fields = []
+        for key in keys:
+            # Re-insert to keep the cache ordered by last use
+            entry = self._result_cache.pop(key, None)
+            if entry is not None:
+                self._result_cache[key] = entry
+            fields.append(entry)
+        return fields
+    
+    def _count_entries(self, directory: Path) -> int:
+        """Count directory entries without building Path objects"""
+        try:
+            with os.scandir(directory) as entries:
+                return sum(1 for _ in entries)
+        except NotADirectoryError:
+            return 0
     
     def generate_summary(self):
         """Generate complete system summary"""
-        print("🔍 Analyzing KPI Processing System...")
-        print("="*80)
+        sys.stdout.write(ANALYSIS_HEADER)
+        
+        self._stat_cache = {}
+        self._main_config = None
+        self.__dict__.pop('organization_name', None)
+        self._latest_overview = None
+        self._result_cache = self._load_result_cache()
         
         # Analyze system components
         self.analyze_system_health()
@@ -47,6 +274,7 @@ class FinalSummaryGenerator:
         self.analyze_configuration()
         self.analyze_performance_trends()
         self.generate_recommendations()
+        self._save_result_cache()
         
         # Display summary
         self.display_summary()
@@ -58,6 +286,7 @@ class FinalSummaryGenerator:
         """Analyze overall system health"""
         print("📊 Analyzing System Health...")
         
+        now_ts = time.time()
         health = {
             'directories': {},
             'files': {},
@@ -79,7 +308,7 @@ class FinalSummaryGenerator:
         for dir_name, dir_path in dirs_to_check.items():
             health['directories'][dir_name] = {
                 'exists': dir_path.exists(),
-                'file_count': len(list(dir_path.glob('*'))) if dir_path.exists() else 0,
+                'file_count': self._count_entries(dir_path) if dir_path.exists() else 0,
                 'size_mb': self.get_directory_size(dir_path) if dir_path.exists() else 0
             }
         
@@ -94,35 +323,48 @@ class FinalSummaryGenerator:
         }
         
         for file_name, file_path in critical_files.items():
-            if file_path.exists():
-                stat = file_path.stat()
-                health['files'][file_name] = {
-                    'exists': True,
-                    'size_kb': round(stat.st_size / 1024, 1),
-                    'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                }
-            else:
+            # A single stat both probes existence and supplies the details
+            try:
+                stat = self._stat(file_path)
+            except (FileNotFoundError, NotADirectoryError):
                 health['files'][file_name] = {'exists': False}
+                continue
+            health['files'][file_name] = {
+                'exists': True,
+                'size_kb': round(stat.st_size / 1024, 1),
+                'modified': _format_timestamp(int(stat.st_mtime))
+            }
         
         # Check data availability
         data_dir = Path("data")
         if data_dir.exists():
-            csv_files = list(data_dir.glob("*.csv"))
+            # Names and total size in a single scandir pass
+            csv_names = []
+            total_size = 0
+            with os.scandir(data_dir) as entries:
+                for entry in entries:
+                    if os.path.normcase(entry.name).endswith(".csv"):
+                        csv_names.append(entry.name)
+                        total_size += entry.stat().st_size
             health['data_availability'] = {
-                'csv_files_count': len(csv_files),
-                'csv_files': [f.name for f in csv_files],
-                'total_data_size_mb': sum(f.stat().st_size for f in csv_files) / (1024*1024)
+                'csv_files_count': len(csv_names),
+                'csv_files': csv_names,
+                'total_data_size_mb': total_size / (1024*1024)
             }
         
         # Check last activity
         if self.output_dir.exists():
-            output_files = list(self.output_dir.glob("*.json"))
-            if output_files:
-                latest_output = max(output_files, key=lambda f: f.stat().st_mtime)
+            latest_output = None
+            latest_mtime = 0
+            for file_path in self._scan(self.output_dir, ".json"):
+                file_mtime = self._stat(file_path).st_mtime
+                if latest_output is None or file_mtime > latest_mtime:
+                    latest_output, latest_mtime = file_path, file_mtime
+            if latest_output is not None:
                 health['last_activity'] = {
-                    'last_processing': datetime.fromtimestamp(latest_output.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                    'latest_file': latest_output.name,
-                    'hours_ago': round((datetime.now().timestamp() - latest_output.stat().st_mtime) / 3600, 1)
+                    'last_processing': _format_timestamp(int(latest_mtime)),
+                    'latest_file': os.path.basename(latest_output),
+                    'hours_ago': round((now_ts - latest_mtime) / 3600, 1)
                 }
         
         # Determine overall status
@@ -154,57 +396,85 @@ class FinalSummaryGenerator:
             return
         
         # Find all result files
-        result_files = list(self.output_dir.glob("*.json"))
+        result_files = self._scan(self.output_dir, ".json")
         if not result_files:
             self.latest_results = {'status': 'No result files found'}
             return
         
-        # Get the most recent results by type
-        result_types = {
-            'baseline': ['baseline_results.json', 'quick_results.json'],
-            'incremental': ['incremental_results.json'],
-            'targeted': ['targeted_', 'sm001_', 'sm004_'],
-            'test': ['test_', 'validation_']
-        }
+        # One pass over the listing: keep the newest file per type (first listed wins ties)
+        latest_files = {}
+        dated_files = []
+        for file_path in result_files:
+            try:
+                file_time = self._stat(file_path).st_mtime
+            except OSError:  # dangling link, which could not be opened either
+                continue
+            dated_files.append((file_time, file_path))
+            
+            file_name = os.path.basename(file_path).lower()
+            for result_type, patterns in _RESULT_TYPES.items():
+                if any(pattern in file_name for pattern in patterns):
+                    best = latest_files.get(result_type)
+                    if best is None or file_time > best[0]:
+                        latest_files[result_type] = (file_time, file_path)
         
         latest_by_type = {}
+        found_types = [result_type for result_type in _RESULT_TYPES if result_type in latest_files]
+        loaded = _read_json_files([latest_files[result_type][1] for result_type in found_types])
         
-        for result_type, patterns in result_types.items():
-            matching_files = []
-            for file_path in result_files:
-                if any(pattern in file_path.name.lower() for pattern in patterns):
-                    matching_files.append(file_path)
-            
-            if matching_files:
-                # Get the most recent file
-                latest_file = max(matching_files, key=lambda f: f.stat().st_mtime)
-                try:
-                    with open(latest_file, 'r') as f:
-                        data = json.load(f)
-                        data['_file_name'] = latest_file.name
-                        data['_file_time'] = latest_file.stat().st_mtime
-                        latest_by_type[result_type] = data
-                except Exception as e:
-                    latest_by_type[result_type] = {'error': str(e), '_file_name': latest_file.name}
-        
-        # Find overall latest result with KPI data
+        for result_type, (data, error) in zip(found_types, loaded):
+            file_time, latest_file = latest_files[result_type]
+            try:
+                if error is not None:
+                    raise error
+                data['_file_name'] = os.path.basename(latest_file)
+                data['_file_time'] = file_time
+                latest_by_type[result_type] = data
+            except Exception as e:
+                latest_by_type[result_type] = {'error': str(e), '_file_name': os.path.basename(latest_file)}
+        
+        # Find overall latest result with KPI data: newest first (the sort is stable, so equal
+        # times keep listing order) and stop at the first match instead of opening every file
         latest_overall = None
-        latest_time = 0
+        dated_files.sort(key=lambda item: item[0], reverse=True)
         
-        for file_path in result_files:
+        for file_time, file_path in dated_files:
+            if file_time <= 0:
+                break
             try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    file_time = file_path.stat().st_mtime
-                    if (file_time > latest_time and 
-                        ('baseline_kpis' in data or 'overall_score' in data)):
-                        latest_overall = data
-                        latest_overall['_file_name'] = file_path.name
-                        latest_overall['_file_time'] = file_time
-                        latest_time = file_time
+                with open(file_path, 'rb') as f:
+                    raw = f.read()
+                # Files that do not mention either key cannot qualify, so skip parsing them
+                if b'"baseline_kpis"' not in raw and b'"overall_score"' not in raw:
+                    continue
+                data = _parse_json(raw)
+                if 'baseline_kpis' in data or 'overall_score' in data:
+                    data['_file_name'] = os.path.basename(file_path)
+                    data['_file_time'] = file_time
+                    latest_overall = data
+                    break
             except:
                 continue
         
+        # Normalize what display_summary shows once, while the result's shape is being handled anyway
+        self._latest_overview = None
+        if latest_overall is not None:
+            records_processed = latest_overall.get('records_processed', 'Unknown')
+            score_line = None
+            if 'overall_score' in latest_overall:
+                score_data = latest_overall['overall_score']
+                if isinstance(score_data, dict):
+                    score_line = (f"{score_data.get('overall_score', 'Unknown')}/100 "
+                                  f"({score_data.get('performance_band', 'Unknown')})")
+                else:
+                    score_line = f"{score_data}"
+            self._latest_overview = {
+                'last_processing': _format_timestamp(int(latest_overall['_file_time'])),
+                'file_name': latest_overall['_file_name'],
+                'records': f"{records_processed:,}" if isinstance(records_processed, int) else f"{records_processed}",
+                'score': score_line
+            }
+        
         self.latest_results = {
             'by_type': latest_by_type,
             'latest_overall': latest_overall,
@@ -225,15 +495,14 @@ class FinalSummaryGenerator:
         }
         
         # Check for configuration files
-        config_files = list(self.config_dir.glob("*.yaml")) + list(self.config_dir.glob("*.yml"))
-        config_analysis['files_found'] = [f.name for f in config_files]
+        config_files = self._scan(self.config_dir, ".yaml") + self._scan(self.config_dir, ".yml")
+        config_analysis['files_found'] = [os.path.basename(f) for f in config_files]
         
         # Analyze main configuration
         main_config_path = self.config_dir / "kpi_config.yaml"
         if main_config_path.exists():
             try:
-                with open(main_config_path, 'r') as f:
-                    config = yaml.safe_load(f)
+                config = self._load_main_config()
                 
                 # Analyze KPI configuration
                 kpis = config.get('kpis', {})
@@ -292,16 +561,17 @@ class FinalSummaryGenerator:
             return
         
         # Collect historical processing data
-        result_files = sorted(self.output_dir.glob("*.json"), key=lambda f: f.stat().st_mtime)
-        
-        for file_path in result_files[-10:]:  # Last 10 files
+        # Last 10 files by mtime, oldest first; the listing index breaks ties as a stable sort would
+        result_files = self._scan(self.output_dir, ".json")
+        recent = heapq.nlargest(10, ((self._stat(f).st_mtime, i, f) for i, f in enumerate(result_files)))
+        recent_files = [file_path for _, _, file_path in sorted(recent)]
+        for file_path, data in zip(recent_files, self._read_history_fields(recent_files)):
+            if data is None:
+                continue
             try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                
                 processing_record = {
-                    'file': file_path.name,
-                    'timestamp': datetime.fromtimestamp(file_path.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
+                    'file': os.path.basename(file_path),
+                    'timestamp': _format_timestamp(int(self._stat(file_path).st_mtime)),
                     'mode': data.get('mode', 'Unknown'),
                     'records': data.get('records_processed', 0),
                     'processing_time': data.get('processing_time', 'Unknown')
@@ -329,24 +599,23 @@ class FinalSummaryGenerator:
                 continue
         
         # Analyze KPI trends
+        kpi_trends = defaultdict(list)
         for record in trends['processing_history']:
             if 'overall_score' in record:
-                date_key = record['timestamp'][:10]  # YYYY-MM-DD
-                if date_key not in trends['kpi_trends']:
-                    trends['kpi_trends'][date_key] = []
-                trends['kpi_trends'][date_key].append(record['overall_score'])
-        
-        # Calculate performance summary
-        if trends['processing_history']:
-            recent_scores = [r.get('overall_score', 0) for r in trends['processing_history'][-5:] 
-                           if 'overall_score' in r]
-            if recent_scores:
-                trends['performance_summary'] = {
-                    'average_recent_score': round(sum(recent_scores) / len(recent_scores), 1),
-                    'best_recent_score': max(recent_scores),
-                    'worst_recent_score': min(recent_scores),
-                    'score_trend': 'improving' if len(recent_scores) >= 2 and recent_scores[-1] > recent_scores[0] else 'stable'
-                }
+                kpi_trends[record['timestamp'][:10]].append(record['overall_score'])  # YYYY-MM-DD
+        trends['kpi_trends'] = dict(kpi_trends)
+        
+        # Calculate performance summary over the last 5 runs with the C builtins; numpy would cost
+        # more to import than it saves on five values and would report int scores as floats
+        recent_scores = [r['overall_score'] for r in trends['processing_history'][-5:] if 'overall_score' in r]
+        if recent_scores:
+            score_count = len(recent_scores)
+            trends['performance_summary'] = {
+                'average_recent_score': round(sum(recent_scores) / score_count, 1),
+                'best_recent_score': max(recent_scores),
+                'worst_recent_score': min(recent_scores),
+                'score_trend': 'improving' if score_count >= 2 and recent_scores[-1] > recent_scores[0] else 'stable'
+            }
         
         self.performance_trends = trends
     
@@ -433,9 +702,11 @@ class FinalSummaryGenerator:
                 'recommendation': 'Consider maintaining multiple data files for different time periods or testing'
             })
         
-        # Sort by priority
-        priority_order = {'High': 1, 'Medium': 2, 'Low': 3}
-        recommendations.sort(key=lambda x: priority_order.get(x['priority'], 4))
+        # Sort by priority; the index keeps equal priorities in insertion order
+        ranked = sorted(
+            (_PRIORITY_RANK.get(rec['priority'], 4), i, rec) for i, rec in enumerate(recommendations)
+        )
+        recommendations = [rec for _, _, rec in ranked]
         
         self.recommendations = recommendations
     
@@ -451,110 +722,110 @@ class FinalSummaryGenerator:
     def get_directory_size(self, directory: Path) -> float:
         """Get directory size in MB"""
         try:
-            total_size = sum(f.stat().st_size for f in directory.rglob('*') if f.is_file())
+            # Iterative scandir walk; like rglob it does not descend into symlinked directories
+            total_size = 0
+            stack = [os.fspath(directory)]
+            while stack:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            total_size += entry.stat().st_size
             return round(total_size / (1024 * 1024), 2)
         except:
             return 0
     
     def display_summary(self):
         """Display the complete system summary"""
-        print("\n" + "="*80)
-        print("                          FINAL SYSTEM SUMMARY")
-        print("="*80)
+        sys.stdout.write(self.render_summary())
+        sys.stdout.flush()
+    
+    def render_summary(self) -> str:
+        """Render the complete system summary as text, e.g. for callers that store it instead of printing"""
+        # Lines are collected and joined once rather than printed one by one
+        out = []
+        w = out.append
+        
+        w(SUMMARY_HEADER)
         
         # Header with timestamp
-        print(f"📅 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"🏢 Organization: {self.get_organization_name()}")
-        print()
+        w(f"📅 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        w(f"🏢 Organization: {self.organization_name}")
+        w('')
         
         # System Health Overview
-        print("🏥 SYSTEM HEALTH")
-        print("-"*60)
+        w("🏥 SYSTEM HEALTH")
+        w(SECTION_RULE)
         status = self.system_health.get('overall_status', 'Unknown')
-        status_icon = {"Healthy": "✅", "Needs Attention": "⚠️", "Critical Issues": "🚨"}.get(status, "❓")
-        print(f"Overall Status: {status_icon} {status}")
+        status_icon = _HEALTH_ICONS.get(status, "❓")
+        w(f"Overall Status: {status_icon} {status}")
         
         if status == 'Critical Issues':
-            print("Critical Issues:")
+            w("Critical Issues:")
             for issue in self.system_health.get('critical_issues', []):
-                print(f"  🔴 {issue}")
+                w(f"  🔴 {issue}")
         
         # Directory status
-        print("\nDirectory Structure:")
+        w("\nDirectory Structure:")
         for dir_name, dir_info in self.system_health.get('directories', {}).items():
             status_icon = "✅" if dir_info['exists'] else "❌"
             file_count = dir_info.get('file_count', 0)
             size_mb = dir_info.get('size_mb', 0)
-            print(f"  {status_icon} {dir_name:12} - {file_count:3} files ({size_mb:6.1f} MB)")
+            w(f"  {status_icon} {dir_name:12} - {file_count:3} files ({size_mb:6.1f} MB)")
         
         # Latest Processing Results
-        print(f"\n📊 LATEST PROCESSING RESULTS")
-        print("-"*60)
-        
-        latest_overall = self.latest_results.get('latest_overall')
-        if latest_overall and isinstance(latest_overall, dict):
-            file_time_stamp = latest_overall.get('_file_time', 0)
-            if isinstance(file_time_stamp, (int, float)):
-                file_time = datetime.fromtimestamp(file_time_stamp).strftime('%Y-%m-%d %H:%M:%S')
-                print(f"Last Processing: {file_time}")
-            
-            file_name = latest_overall.get('_file_name', 'Unknown')
-            print(f"Source File: {file_name}")
-            
-            records_processed = latest_overall.get('records_processed', 'Unknown')
-            if isinstance(records_processed, int):
-                print(f"Records Processed: {records_processed:,}")
-            else:
-                print(f"Records Processed: {records_processed}")
+        w(f"\n📊 LATEST PROCESSING RESULTS")
+        w(SECTION_RULE)
+        
+        overview = self._latest_overview
+        if overview:
+            latest_overall = self.latest_results['latest_overall']
+            w(f"Last Processing: {overview['last_processing']}")
+            w(f"Source File: {overview['file_name']}")
+            w(f"Records Processed: {overview['records']}")
             
             # Overall score
-            if 'overall_score' in latest_overall:
-                score_data = latest_overall.get('overall_score')
-                if isinstance(score_data, dict):
-                    score = score_data.get('overall_score', 'Unknown')
-                    band = score_data.get('performance_band', 'Unknown')
-                    print(f"Overall Score: {score}/100 ({band})")
-                else:
-                    print(f"Overall Score: {score_data}")
+            if overview['score'] is not None:
+                w(f"Overall Score: {overview['score']}")
             
             # KPI Summary
             baseline_kpis = latest_overall.get('baseline_kpis')
             if baseline_kpis and isinstance(baseline_kpis, dict):
-                print("\nKPI Status Summary:")
+                w("\nKPI Status Summary:")
                 for kpi_id, kpi_data in baseline_kpis.items():
                     if isinstance(kpi_data, dict):
                         status = kpi_data.get('status', 'Unknown')
-                        status_icon = {"Target Met": "✅", "Above Target": "⚠️", "Below Target": "❌", 
-                                      "Needs Improvement": "⚠️", "Critical": "🚨"}.get(status, "❓")
-                        print(f"  {status_icon} {kpi_id}: {status}")
+                        status_icon = _KPI_STATUS_ICONS.get(status, "❓")
+                        w(f"  {status_icon} {kpi_id}: {status}")
         else:
-            print("❌ No recent processing results found")
+            w("❌ No recent processing results found")
         
         # Configuration Analysis
-        print(f"\n⚙️  CONFIGURATION ANALYSIS")
-        print("-"*60)
+        w(f"\n⚙️  CONFIGURATION ANALYSIS")
+        w(SECTION_RULE)
         
         enabled_kpis = self.config_analysis.get('kpis_enabled', [])
         disabled_kpis = self.config_analysis.get('kpis_disabled', [])
         
-        print(f"KPIs Enabled: {len(enabled_kpis)}")
+        w(f"KPIs Enabled: {len(enabled_kpis)}")
         for kpi in enabled_kpis:
-            print(f"  ✅ {kpi['id']}: {kpi['name']} ({kpi['priority']} priority)")
+            w(f"  ✅ {kpi['id']}: {kpi['name']} ({kpi['priority']} priority)")
         
         if disabled_kpis:
-            print(f"\nKPIs Disabled: {len(disabled_kpis)}")
+            w(f"\nKPIs Disabled: {len(disabled_kpis)}")
             for kpi in disabled_kpis:
-                print(f"  ❌ {kpi['id']}: {kpi['name']}")
+                w(f"  ❌ {kpi['id']}: {kpi['name']}")
         
         config_issues = self.config_analysis.get('configuration_issues', [])
         if config_issues:
-            print("\nConfiguration Issues:")
+            w("\nConfiguration Issues:")
             for issue in config_issues:
-                print(f"  ⚠️  {issue}")
+                w(f"  ⚠️  {issue}")
         
         # Performance Trends
-        print(f"\n📈 PERFORMANCE TRENDS")
-        print("-"*60)
+        w(f"\n📈 PERFORMANCE TRENDS")
+        w(SECTION_RULE)
         
         performance_summary = self.performance_trends.get('performance_summary', {})
         if performance_summary:
@@ -562,54 +833,57 @@ class FinalSummaryGenerator:
             best_score = performance_summary.get('best_recent_score', 0)
             trend = performance_summary.get('score_trend', 'stable')
             
-            trend_icon = {"improving": "📈", "declining": "📉", "stable": "➡️"}.get(trend, "❓")
-            print(f"Recent Average Score: {avg_score}/100")
-            print(f"Best Recent Score: {best_score}/100")
-            print(f"Trend: {trend_icon} {trend.title()}")
+            trend_icon = _TREND_ICONS.get(trend, "❓")
+            w(f"Recent Average Score: {avg_score}/100")
+            w(f"Best Recent Score: {best_score}/100")
+            w(f"Trend: {trend_icon} {trend.title()}")
         else:
-            print("❌ Insufficient data for trend analysis")
+            w("❌ Insufficient data for trend analysis")
         
         # Processing History
         history = self.performance_trends.get('processing_history', [])
         if history:
-            print(f"\nRecent Processing Activity ({len(history)} runs):")
+            w(f"\nRecent Processing Activity ({len(history)} runs):")
             for record in history[-5:]:  # Show last 5
                 timestamp = record['timestamp']
                 mode = record['mode']
                 records = record.get('records', 0)
                 score = record.get('overall_score', 'N/A')
-                print(f"  📋 {timestamp} - {mode:12} - {records:,} records - Score: {score}")
+                w(f"  📋 {timestamp} - {mode:12} - {records:,} records - Score: {score}")
         
         # Recommendations
-        print(f"\n💡 RECOMMENDATIONS")
-        print("-"*60)
+        w(f"\n💡 RECOMMENDATIONS")
+        w(SECTION_RULE)
         
         if self.recommendations:
             for i, rec in enumerate(self.recommendations, 1):
                 priority = rec['priority']
-                priority_icon = {"High": "🔴", "Medium": "🟡", "Low": "🟢"}.get(priority, "⚪")
+                priority_icon = _PRIORITY_ICONS.get(priority, "⚪")
                 
-                print(f"{i}. {priority_icon} {rec['category']} ({priority} Priority)")
-                print(f"   Issue: {rec['issue']}")
-                print(f"   Action: {rec['recommendation']}")
-                print()
+                w(f"{i}. {priority_icon} {rec['category']} ({priority} Priority)")
+                w(f"   Issue: {rec['issue']}")
+                w(f"   Action: {rec['recommendation']}")
+                w('')
         else:
-            print("✅ No recommendations - system appears to be operating well!")
+            w("✅ No recommendations - system appears to be operating well!")
         
         # Footer
-        print("="*80)
-        print("💡 TIP: Run individual components from the main menu to address any issues")
-        print("📧 Contact IT Service Management Team for additional support")
-        print("="*80)
+        w(SUMMARY_FOOTER)
+        
+        return "\n".join(out) + "\n"
+    
+    @cached_property
+    def organization_name(self) -> str:
+        """Organization name, looked up once per run"""
+        return self.get_organization_name()
     
     def get_organization_name(self) -> str:
         """Get organization name from configuration"""
         config_path = self.config_dir / "kpi_config.yaml"
         if config_path.exists():
             try:
-                with open(config_path, 'r') as f:
-                    config = yaml.safe_load(f)
-                    return config.get('metadata', {}).get('organization', 'Unknown Organization')
+                config = self._load_main_config()
+                return config.get('metadata', {}).get('organization', 'Unknown Organization')
             except:
                 pass
         return 'Unknown Organization'
@@ -621,7 +895,7 @@ class FinalSummaryGenerator:
         
         report_data = {
             'generated_at': datetime.now().isoformat(),
-            'organization': self.get_organization_name(),
+            'organization': self.organization_name,
             'system_health': self.system_health,
             'latest_results': self.latest_results,
             'config_analysis': self.config_analysis,
@@ -633,17 +907,43 @@ class FinalSummaryGenerator:
             # Create output directory if it doesn't exist
             self.output_dir.mkdir(exist_ok=True)
             
-            with open(report_file, 'w') as f:
-                json.dump(report_data, f, indent=2, default=str)
+            payload = None
+            if orjson is not None:
+                try:
+                    # Datetimes pass through to default=str so they are written as before
+                    payload = orjson.dumps(
+                        report_data,
+                        default=str,
+                        option=(orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY |
+                                orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+                    )
+                except orjson.JSONEncodeError:  # e.g. integers beyond 64 bits
+                    payload = None
+            
+            if payload is not None:
+                report_file.write_bytes(payload)
+            else:
+                with open(report_file, 'w') as f:
+                    json.dump(report_data, f, indent=2, default=str)
             
             print(f"\n💾 Summary report saved to: {report_file}")
         except Exception as e:
             print(f"\n⚠️  Warning: Could not save summary report: {e}")
 
+def _use_utf8_stdout():
+    """Switch stdout to UTF-8 so the emoji output cannot fail on a legacy code page (e.g. redirected on Windows)"""
+    reconfigure = getattr(sys.stdout, 'reconfigure', None)
+    if reconfigure is None or (sys.stdout.encoding or '').lower().replace('-', '') == 'utf8':
+        return
+    try:
+        reconfigure(encoding='utf-8')
+    except (ValueError, OSError):
+        pass
+
 def main():
     """Main function to generate final summary"""
-    print("🚀 KPI Processing System - Final Summary Generator")
-    print("="*80)
+    _use_utf8_stdout()
+    sys.stdout.write(BANNER)
     
     generator = FinalSummaryGenerator()
     
@@ -6,21 +6,90 @@ Simple wrapper for the complete configurable processor with Excel and data trans
 """
 
 import sys
-import argparse
 from pathlib import Path
-import pandas as pd
-import tempfile
+from types import SimpleNamespace
 import os
 
-# Add scripts directory to path
-sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+# pandas, tempfile and the processor module are imported where they are first needed,
+# so --help and argument errors return without loading them
 
-try:
-    from complete_configurable_processor import CompleteConfigurableProcessor
-except ImportError:
-    print(" Error: complete_configurable_processor.py not found in scripts/")
-    print("   Please ensure the scripts directory contains the main processor.")
-    sys.exit(1)
+PROCESSING_MODES = ('baseline', 'incremental', 'targeted')
+
+# Command line options: flag -> (attribute, allowed values or None), with their defaults
+CLI_OPTIONS = {
+    '--mode': ('mode', PROCESSING_MODES),
+    '--kpi': ('kpi', None),
+    '--input': ('input', None),
+    '--config': ('config', None),
+    '--output': ('output', None)
+}
+CLI_DEFAULTS = {
+    'mode': 'baseline',
+    'kpi': None,
+    'input': None,
+    'config': 'config/kpi_config.yaml',
+    'output': None
+}
+
+# EMEA data column mapping, and the EMEA column names used to recognise that format
+EMEA_COLUMN_MAPPING = {
+    'Number': 'number',
+    'Priority': 'priority', 
+    'Created': 'opened_at',
+    'Resolved': 'resolved_at',
+    'Incident State': 'state',
+    'Reassignment count': 'reassignment_count',
+    'Country': 'country',
+    'Assignment group': 'assignment_group',
+    'Short description': 'description',
+    'Category': 'category',
+    'Subcategory': 'subcategory'
+}
+EMEA_COLUMNS = frozenset(EMEA_COLUMN_MAPPING)
+
+# Converted and transformed copies of input files, reused while the source file is unchanged.
+# Kept with the processor cache rather than under data/, where they would count as input data
+TRANSFORM_CACHE_DIR = Path("cache/transformed")
+
+# Cache files are written under this prefix and renamed when complete; partial files older
+# than STALE_PARTIAL_SECONDS were left by an interrupted run and are removed
+PARTIAL_PREFIX = '.partial-'
+STALE_PARTIAL_SECONDS = 3600
+
+DATA_FILE_SUFFIXES = ('.csv', '.xls', '.xlsx')
+
+# Directories with more data files than this are stat'd from a thread pool (stat releases the GIL,
+# which helps on network filesystems); smaller ones are stat'd one after another
+PARALLEL_STAT_THRESHOLD = 64
+PARALLEL_STAT_WORKERS = 16
+
+# File discovery and column details are only printed when KPI_VERBOSE is set
+VERBOSE = bool(os.environ.get("KPI_VERBOSE"))
+
+def _mtime_ns(entry):
+    return entry.stat().st_mtime_ns
+
+def find_latest_data_file(directory):
+    """Return (most recently modified data file in directory or None, number of data files)"""
+    with os.scandir(directory) as entries:
+        candidates = [
+            entry for entry in entries
+            if not entry.name.startswith('.')
+            and entry.name.lower().endswith(DATA_FILE_SUFFIXES)
+            and entry.is_file()
+        ]
+    if not candidates:
+        return None, 0
+    
+    if len(candidates) > PARALLEL_STAT_THRESHOLD:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=PARALLEL_STAT_WORKERS) as executor:
+            mtimes = list(executor.map(_mtime_ns, candidates))
+    else:
+        mtimes = [_mtime_ns(entry) for entry in candidates]
+    
+    latest_index = mtimes.index(max(mtimes))
+    return candidates[latest_index].path, len(candidates)
 
 def find_latest_raw_data():
     """Find the most recent data file (CSV or Excel) in data/raw/ directory"""
@@ -29,42 +98,30 @@ def find_latest_raw_data():
     # Create data/raw directory if it doesn't exist
     raw_data_dir.mkdir(parents=True, exist_ok=True)
     
-    print(f" Searching for data files in: {raw_data_dir}")
-    
-    # Find all data files in data/raw/ (CSV and Excel)
-    data_files = []
-    data_files.extend(raw_data_dir.glob("*.csv"))
-    data_files.extend(raw_data_dir.glob("*.xls"))
-    data_files.extend(raw_data_dir.glob("*.xlsx"))
+    if VERBOSE:
+        print(f" Searching for data files in: {raw_data_dir}")
     
-    print(f" Found {len(data_files)} data files in data/raw/:")
-    for f in data_files:
-        print(f"   - {f.name}")
+    # Find the newest data file in data/raw/ (CSV and Excel) in one directory pass
+    latest_file, count = find_latest_data_file(raw_data_dir)
+    if VERBOSE:
+        print(f" Found {count} data files in data/raw/")
     
-    if data_files:
-        # Return the most recent file from data/raw/
-        latest_file = max(data_files, key=lambda p: p.stat().st_mtime)
+    if latest_file:
         print(f" Auto-detected latest file: {latest_file}")
-        return str(latest_file)
+        return latest_file
     
     # Fallback: check data/ directory for backward compatibility
     data_dir = Path("data")
     if data_dir.exists():
-        print(f" No files in data/raw/, checking fallback: {data_dir}")
-        data_files = []
-        data_files.extend(data_dir.glob("*.csv"))
-        data_files.extend(data_dir.glob("*.xls"))
-        data_files.extend(data_dir.glob("*.xlsx"))
+        if VERBOSE:
+            print(f" No files in data/raw/, checking fallback: {data_dir}")
+        latest_file, count = find_latest_data_file(data_dir)
+        if VERBOSE:
+            print(f" Found {count} data files in data/")
         
-        print(f" Found {len(data_files)} data files in data/:")
-        for f in data_files:
-            print(f"   - {f.name}")
-        
-        if data_files:
-            # Return the most recent file from data/
-            latest_file = max(data_files, key=lambda p: p.stat().st_mtime)
+        if latest_file:
             print(f" Using fallback file: {latest_file}")
-            return str(latest_file)
+            return latest_file
     
     # No data files found anywhere
     print("  No CSV or Excel files found in data/raw/ or data/")
@@ -72,6 +129,8 @@ def find_latest_raw_data():
 
 def load_data_file(file_path):
     """Load data from CSV or Excel file"""
+    import pandas as pd
+    
     file_path = Path(file_path)
     
     try:
@@ -87,86 +146,286 @@ def load_data_file(file_path):
         print(f" Error loading {file_path}: {e}")
         raise
 
+def read_header_only(file_path):
+    """Read only the column names from the first row of a CSV or Excel file"""
+    file_path = Path(file_path)
+    suffix = file_path.suffix.lower()
+    
+    if suffix == '.csv':
+        import csv
+        with open(file_path, newline='', encoding='utf-8-sig') as f:
+            return next(csv.reader(f), [])
+    
+    if suffix == '.xlsx':
+        try:
+            import openpyxl
+        except ImportError:
+            openpyxl = None
+        if openpyxl is not None:
+            workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+            try:
+                header = next(workbook.active.iter_rows(max_row=1, values_only=True), ())
+            finally:
+                workbook.close()
+            return [name for name in header if name is not None]
+    
+    if suffix in ['.xls', '.xlsx']:
+        import pandas as pd
+        return list(pd.read_excel(file_path, nrows=0).columns)
+    
+    raise ValueError(f"Unsupported file format: {file_path.suffix}")
+
+def write_dataframe_csv(df, csv_file):
+    """Write a DataFrame to CSV exactly as the processor would see it in memory
+    
+    Uses pandas' writer: pyarrow's quotes the header and writes timestamps and booleans
+    differently, so later runs reading the cached CSV would get different text.
+    """
+    df.to_csv(csv_file, index=False)
+
+def load_renamed_data(input_file):
+    """Load a data file with pandas and apply the EMEA column mapping"""
+    df = load_data_file(input_file)
+    df.rename(columns=EMEA_COLUMN_MAPPING, inplace=True)
+    return df
+
+def rename_csv_columns(input_file, header, csv_file):
+    """Write a copy of a CSV file with EMEA column names mapped, through pyarrow when installed
+    
+    Returns the DataFrame when the file had to be loaded with pandas, otherwise None.
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
+    except ImportError:
+        df = load_renamed_data(input_file)
+        write_dataframe_csv(df, csv_file)
+        return df
+    
+    # Read every column as text so values are written back exactly as they were read;
+    # quoted values may span lines (e.g. multi-line short descriptions)
+    convert_options = pacsv.ConvertOptions(column_types={name: pa.string() for name in header})
+    parse_options = pacsv.ParseOptions(newlines_in_values=True)
+    try:
+        table = pacsv.read_csv(input_file, parse_options=parse_options, convert_options=convert_options)
+    except pa.ArrowInvalid as e:
+        # Rows pyarrow cannot parse are left to pandas, as without pyarrow
+        print(f"  pyarrow could not parse {Path(input_file).name} ({e}); loading it with pandas...")
+        df = load_renamed_data(input_file)
+        write_dataframe_csv(df, csv_file)
+        return df
+    table = table.rename_columns([EMEA_COLUMN_MAPPING.get(name, name) for name in table.column_names])
+    pacsv.write_csv(table, csv_file)
+    return None
+
+def write_excel_as_csv(input_file, csv_file):
+    """Write the first sheet of an Excel file to CSV, streaming rows when python-calamine is installed
+    
+    Returns the DataFrame when the file had to be loaded with pandas, otherwise None.
+    """
+    try:
+        from python_calamine import CalamineWorkbook
+    except ImportError:
+        df = load_data_file(input_file)
+        write_dataframe_csv(df, csv_file)
+        return df
+    
+    import csv
+    
+    print(f" Streaming Excel file: {Path(input_file).name}")
+    sheet = CalamineWorkbook.from_path(str(input_file)).get_sheet_by_index(0)
+    with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f).writerows(sheet.iter_rows())
+    return None
+
+def transform_cache_path(input_file):
+    """Cache location for the CSV made from input_file, keyed on its path, mtime and size"""
+    import zlib
+    
+    source = Path(input_file)
+    st = source.stat()
+    path_hash = zlib.crc32(str(source.resolve()).encode('utf-8'))
+    return TRANSFORM_CACHE_DIR / f"{source.stem}-{path_hash:08x}-{st.st_mtime_ns}-{st.st_size}.csv"
+
+def write_cached_csv(cache_path, write):
+    """Create cache_path atomically with write(path) and drop older copies made from the same source
+    
+    Returns whatever write returned.
+    """
+    import tempfile
+    import time
+    
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(prefix=PARTIAL_PREFIX, suffix='.csv', dir=cache_path.parent, delete=False) as temp_file:
+        temp_path = temp_file.name
+    try:
+        result = write(temp_path)
+        os.replace(temp_path, cache_path)
+    except BaseException:
+        # Also covers KeyboardInterrupt, so an interrupted conversion leaves no partial file
+        os.unlink(temp_path)
+        raise
+    
+    # The cache is complete at this point; a copy that cannot be removed now (locked on Windows,
+    # already removed by a concurrent run) is left for a later run
+    source_prefix = cache_path.name.rsplit('-', 2)[0] + '-'
+    stale_before = time.time() - STALE_PARTIAL_SECONDS
+    try:
+        with os.scandir(cache_path.parent) as entries:
+            for entry in entries:
+                try:
+                    if entry.name.startswith(source_prefix) and entry.name != cache_path.name:
+                        os.unlink(entry.path)
+                    elif entry.name.startswith(PARTIAL_PREFIX) and entry.stat().st_mtime < stale_before:
+                        os.unlink(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return result
+
+def cache_or_load(cache_path, write, load):
+    """Write the cache CSV with write(path) and return the data for the processor
+    
+    Returns the DataFrame write loaded, else the cache path. When the cache cannot be
+    written (read-only checkout, full disk, ...), returns load() so the data stays in memory.
+    """
+    try:
+        df = write_cached_csv(cache_path, write)
+    except OSError as e:
+        print(f"  Could not write transformed data to {cache_path.parent}: {e}")
+        print(f"   Keeping the transformed data in memory...")
+        return load()
+    return str(cache_path) if df is None else df
+
 def transform_data_if_needed(input_file):
-    """Transform data to expected column format if needed"""
+    """Transform data to expected column format if needed
+    
+    Returns the data to process: a file path, or the DataFrame when one was loaded here.
+    """
     try:
-        print(f" Checking data format in: {Path(input_file).name}")
+        if VERBOSE:
+            print(f" Checking data format in: {Path(input_file).name}")
         
-        # Load the data file (CSV or Excel)
-        df_sample = load_data_file(input_file)
-        if len(df_sample) > 5:
-            df_sample = df_sample.head(5)
-            
-        original_columns = set(df_sample.columns)
-        print(f" Found columns: {sorted(original_columns)}")
+        # A CSV header is cheap to read, so a CSV already in the expected format
+        # is returned before the cache lookup and without loading pandas
+        suffix = Path(input_file).suffix.lower()
+        header = read_header_only(input_file) if suffix == '.csv' else None
+        original_columns = set(header) if header is not None else None
+        if original_columns is not None and not EMEA_COLUMNS & original_columns:
+            if VERBOSE:
+                print(f" Found columns: {sorted(original_columns)}")
+            print("ℹ  Data already in expected CSV format")
+            return input_file
         
-        # EMEA data column mapping
-        emea_column_mapping = {
-            'Number': 'number',
-            'Priority': 'priority', 
-            'Created': 'opened_at',
-            'Resolved': 'resolved_at',
-            'Incident State': 'state',
-            'Reassignment count': 'reassignment_count',
-            'Country': 'country',
-            'Assignment group': 'assignment_group',
-            'Short description': 'description',
-            'Category': 'category',
-            'Subcategory': 'subcategory'
-        }
+        # Reuse the CSV made on an earlier run while the input file is unchanged
+        cache_path = transform_cache_path(input_file)
+        if cache_path.exists():
+            print(f" Using cached transformed data: {cache_path.name}")
+            return str(cache_path)
+        
+        # Read just the header row (CSV or Excel)
+        if original_columns is None:
+            original_columns = set(read_header_only(input_file))
+        if VERBOSE:
+            print(f" Found columns: {sorted(original_columns)}")
         
         # Check if this looks like EMEA data (has EMEA-style column names)
-        emea_columns = set(emea_column_mapping.keys())
-        matching_columns = emea_columns.intersection(original_columns)
+        matching_columns = EMEA_COLUMNS & original_columns
         
         if matching_columns:
             print(f" Detected EMEA data format - applying column transformation...")
-            print(f"   Matching EMEA columns: {sorted(matching_columns)}")
-            
-            # Load full dataset
-            df = load_data_file(input_file)
+            if VERBOSE:
+                print(f"   Matching EMEA columns: {sorted(matching_columns)}")
             
-            # Apply column mapping
-            df = df.rename(columns=emea_column_mapping)
-            
-            # Create temporary CSV file with transformed data
-            temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False)
-            df.to_csv(temp_file.name, index=False)
-            temp_file.close()
+            if header is not None:
+                # Rename the CSV columns without building a DataFrame
+                data = cache_or_load(cache_path, lambda path: rename_csv_columns(input_file, header, path),
+                                     lambda: load_renamed_data(input_file))
+            else:
+                # Load full dataset, apply column mapping and save it to the cache
+                df = load_renamed_data(input_file)
+                
+                def write_loaded(path):
+                    write_dataframe_csv(df, path)
+                    return df
+                
+                data = cache_or_load(cache_path, write_loaded, lambda: df)
             
             print(f" Data transformed successfully!")
-            print(f"   New columns: {sorted(df.columns)}")
+            if VERBOSE:
+                print(f"   New columns: {sorted(EMEA_COLUMN_MAPPING.get(name, name) for name in original_columns)}")
             
-            return temp_file.name, True
+            # A DataFrame loaded here goes straight to the processor instead of re-reading the CSV
+            return data
         else:
             # Data is already in expected format, but we might need to convert Excel to CSV
-            if Path(input_file).suffix.lower() in ['.xls', '.xlsx']:
+            if suffix in ['.xls', '.xlsx']:
                 print(" Converting Excel to CSV format...")
-                df = load_data_file(input_file)
-                temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False)
-                df.to_csv(temp_file.name, index=False)
-                temp_file.close()
+                data = cache_or_load(cache_path, lambda path: write_excel_as_csv(input_file, path),
+                                     lambda: load_data_file(input_file))
                 print(f" Excel file converted to CSV format")
-                return temp_file.name, True
+                return data
             else:
                 print("ℹ  Data already in expected CSV format")
-                return input_file, False
+                return input_file
             
     except Exception as e:
         print(f"  Could not process data format: {e}")
         print(f"   Proceeding with original file...")
-        return input_file, False
+        return input_file
 
-def main():
+def parse_fast(argv):
+    """Parse a command line made only of known options with valid values; returns None otherwise"""
+    values = dict(CLI_DEFAULTS)
+    i = 0
+    while i < len(argv):
+        flag, has_value, value = argv[i].partition('=')
+        option = CLI_OPTIONS.get(flag)
+        if option is None:
+            return None
+        if not has_value:
+            i += 1
+            if i == len(argv) or argv[i].startswith('-'):
+                return None
+            value = argv[i]
+        attr, choices = option
+        if choices is not None and value not in choices:
+            return None
+        values[attr] = value
+        i += 1
+    return SimpleNamespace(**values)
+
+def _slow_parse(argv):
+    """Parse the command line with argparse (help, errors and abbreviated options)"""
+    import argparse
+    
     parser = argparse.ArgumentParser(description='KPI Processor with Excel and transformation support')
-    parser.add_argument('--mode', choices=['baseline', 'incremental', 'targeted'], 
-                       default='baseline', help='Processing mode')
+    parser.add_argument('--mode', choices=list(PROCESSING_MODES), 
+                       default=CLI_DEFAULTS['mode'], help='Processing mode')
     parser.add_argument('--kpi', help='Specific KPI to process (for targeted mode)')
     parser.add_argument('--input', default=None, help='Input data file (auto-detects latest in data/raw/ if not specified)')
-    parser.add_argument('--config', default='config/kpi_config.yaml', help='Config file')
+    parser.add_argument('--config', default=CLI_DEFAULTS['config'], help='Config file')
     parser.add_argument('--output', help='Output JSON file')
     
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+def main():
+    # Plain option lists are parsed directly; anything else (help, errors) goes through argparse
+    argv = sys.argv[1:]
+    args = parse_fast(argv)
+    if args is None:
+        args = _slow_parse(argv)
+    
+    # Add scripts directory to path
+    sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+    
+    try:
+        from complete_configurable_processor import CompleteConfigurableProcessor
+    except ImportError:
+        print(" Error: complete_configurable_processor.py not found in scripts/")
+        print("   Please ensure the scripts directory contains the main processor.")
+        return 1
     
     # Auto-detect input file if not specified
     if args.input is None:
@@ -178,15 +437,16 @@ def main():
         return 1
     
     # Transform data if needed
-    processed_input, was_transformed = transform_data_if_needed(args.input)
-    temp_file_to_cleanup = processed_input if was_transformed else None
+    processed_input = transform_data_if_needed(args.input)
     
     try:
         print(f" KPI Processor Starting...")
         print(f"Mode: {args.mode}")
         print(f"Config: {args.config}")
         print(f"Input: {args.input}")
-        if was_transformed:
+        if not isinstance(processed_input, str):
+            print("Processed: in-memory data (transformed)")
+        elif processed_input != args.input:
             print(f"Processed: {Path(processed_input).name} (transformed)")
         print("="*50)
         
@@ -209,9 +469,8 @@ def main():
             
             # Save targeted results if output specified
             if args.output:
-                import json
-                with open(args.output, 'w') as f:
-                    json.dump(result, f, indent=2, default=str)
+                from json_output import save_json
+                save_json(result, args.output)
         
         print(f" {args.mode.title()} processing completed successfully!")
         
@@ -224,15 +483,6 @@ def main():
     except Exception as e:
         print(f" Processing failed: {e}")
         return 1
-        
-    finally:
-        # Clean up temporary file if it was created
-        if temp_file_to_cleanup and os.path.exists(temp_file_to_cleanup):
-            try:
-                os.unlink(temp_file_to_cleanup)
-                print(" Cleaned up temporary transformed file")
-            except:
-                pass  # Ignore cleanup errors
 
 if __name__ == "__main__":
     sys.exit(main())
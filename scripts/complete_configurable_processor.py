@@ -25,7 +25,7 @@ import json
 import pickle
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Set, Any, Optional
+from typing import Dict, List, Set, Any, Optional, Union
 import hashlib
 import logging
 import re
@@ -94,6 +94,12 @@ class CompleteConfigurableProcessor:
             self.logger.error(f"❌ Failed to load configuration: {e}")
             raise
     
+    def _read_input(self, input_file: Union[str, pd.DataFrame]) -> pd.DataFrame:
+        """Read input data from a CSV file, or use a DataFrame that is already loaded"""
+        if isinstance(input_file, pd.DataFrame):
+            return input_file
+        return pd.read_csv(input_file)
+    
     def _apply_column_mapping(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply column mappings from configuration"""
         df_mapped = df.copy()
@@ -147,13 +153,13 @@ class CompleteConfigurableProcessor:
         
         return df_copy
     
-    def process_baseline(self, input_file: str, output_file: Optional[str] = None) -> Dict[str, Any]:
+    def process_baseline(self, input_file: Union[str, pd.DataFrame], output_file: Optional[str] = None) -> Dict[str, Any]:
         """Process complete baseline with full configuration"""
         self.logger.info("Configurable baseline processing")
         
         try:
             # Load and map data
-            df_raw = pd.read_csv(input_file)
+            df_raw = self._read_input(input_file)
             df = self._apply_column_mapping(df_raw)
             
             self.logger.info(f"📊 Processing {len(df):,} records for baseline")
@@ -624,7 +630,7 @@ class CompleteConfigurableProcessor:
             else:
                 return 0.0
     
-    def process_incremental(self, input_file: str, previous_results_file: Optional[str] = None, output_file: Optional[str] = None) -> Dict[str, Any]:
+    def process_incremental(self, input_file: Union[str, pd.DataFrame], previous_results_file: Optional[str] = None, output_file: Optional[str] = None) -> Dict[str, Any]:
         """Process incremental updates with full configuration"""
         self.logger.info("⚡ Configurable incremental processing")
         
@@ -633,7 +639,7 @@ class CompleteConfigurableProcessor:
         
         try:
             # Load and map data
-            df_raw = pd.read_csv(input_file)
+            df_raw = self._read_input(input_file)
             df_new = self._apply_column_mapping(df_raw)
             
             self.logger.info(f"📊 Processing {len(df_new):,} records incrementally")
@@ -692,7 +698,7 @@ class CompleteConfigurableProcessor:
             self.logger.error(f"❌ Incremental processing failed: {e}")
             raise
     
-    def process_targeted(self, kpi_id: str, input_file: str) -> Dict[str, Any]:
+    def process_targeted(self, kpi_id: str, input_file: Union[str, pd.DataFrame]) -> Dict[str, Any]:
         """Process targeted KPI update with full configuration"""
         self.logger.info(f"🎯 Configurable targeted processing - {kpi_id}")
         
@@ -705,7 +711,7 @@ class CompleteConfigurableProcessor:
                 raise ValueError(f"KPI '{kpi_id}' is disabled in configuration")
             
             # Load and map data
-            df_raw = pd.read_csv(input_file)
+            df_raw = self._read_input(input_file)
             df_changes = self._apply_column_mapping(df_raw)
             
             # Get required fields from configuration
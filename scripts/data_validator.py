@@ -12,28 +12,111 @@ Comprehensive data validation tool that checks CSV data files for:
 """
 
 import pandas as pd
-import yaml
 import sys
 import json
+import io
+import os
+import mmap
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Iterator, BinaryIO
+from collections import Counter
+from itertools import chain
 import re
+import csv
+import codecs
 import numpy as np
 
+from yaml_cache import load_yaml_cached
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; pandas' C parser is used instead
+    pa_csv = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the report is written with the stdlib json module instead
+    orjson = None
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # pandas < 2.2; date formats are then inferred by pd.to_datetime per chunk
+    guess_datetime_format = None
+
+# Field groups keyed by internal name; mapped fields not listed as numeric load as text
+DATE_FIELDS = ['opened_at', 'resolved_at', 'closed_at']
+NUMERIC_FIELDS = ['reassignment_count']
+TEXT_FIELDS = ['short_description', 'description', 'category']
+DISTRIBUTION_FIELDS = ['priority', 'category', 'country']
+
+# Accepted priority formats, e.g. "1" or "1 - Critical"
+_NUM_PAT = re.compile(r'^\d+$')
+_TXT_PAT = re.compile(r'^\d+\s*-\s*\w+', re.IGNORECASE)
+
+# Rows per chunk when streaming; files below this size are profiled in a single chunk
+CHUNK_SIZE = 500_000
+
+# Bytes per record batch when streaming with pyarrow, roughly comparable to CHUNK_SIZE rows
+ARROW_BLOCK_SIZE = 64 * 1024 * 1024
+
+# Report icons per issue severity
+_SEVERITY_ICONS = {
+    'critical': '🔴',
+    'error': '❌',
+    'warning': '⚠️',
+    'info': 'ℹ️'
+}
+
+# Process exit codes per overall status; any other status exits with 0
+_EXIT_CODES = {
+    'critical': 2,
+    'error': 1
+}
+
+# Files above this size are memory-mapped rather than read through a buffered handle (not on Windows)
+MEMORY_MAP_MIN_BYTES = 64 * 1024 * 1024
+
+# Distribution columns whose sampled unique ratio is below this are profiled as categoricals
+CATEGORY_MAX_RATIO = 0.05
+CATEGORY_SAMPLE_ROWS = 10_000
+
+# Write buffer for the stdlib json report path
+REPORT_WRITE_BUFFER = 1 << 20
+
+# Report directories already created by this process, so repeated saves skip mkdir
+_ENSURED_DIRS = set()
+
 class DataValidator:
     """Validate CSV data files for KPI processing"""
     
-    def __init__(self, config_file: str = "config/kpi_config.yaml"):
+    def __init__(self, config_file: str = "config/kpi_config.yaml", verbose: bool = True):
         self.config_file = config_file
+        self.verbose = verbose
         self.config = {}
         self.validation_results = {}
         self.issues = []
         self.warnings = []
         self.recommendations = []
+        self._parsed_dates = {}
+        self._mapped_nulls = {}
+        self._report_now = None
+        self._log = io.StringIO()
         
         self.load_configuration()
     
+    def _print(self, message: str = ""):
+        """Buffer a progress line; validate_data_file writes the buffer out once"""
+        self._log.write(message + "\n")
+    
+    def flush_log(self):
+        """Write buffered progress output to stdout (when verbose) and reset the buffer"""
+        if self.verbose:
+            sys.stdout.write(self._log.getvalue())
+            sys.stdout.flush()
+        self._log = io.StringIO()
+    
     def load_configuration(self):
         """Load KPI configuration"""
         config_path = Path(self.config_file)
@@ -41,19 +124,19 @@ class DataValidator:
             raise FileNotFoundError(f"Configuration file not found: {self.config_file}")
         
         try:
-            with open(config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
+            self.config = load_yaml_cached(config_path)
             print(f"✅ Configuration loaded from {self.config_file}")
         except Exception as e:
             raise Exception(f"Error loading configuration: {e}")
     
     def validate_data_file(self, data_file: str, quick_check: bool = False) -> Dict[str, Any]:
         """Validate a single data file"""
-        print(f"\n🔍 Validating Data File: {data_file}")
-        print("="*60)
+        self._print(f"\n🔍 Validating Data File: {data_file}")
+        self._print("="*60)
         
         data_path = Path(data_file)
         if not data_path.exists():
+            self.flush_log()
             raise FileNotFoundError(f"Data file not found: {data_file}")
         
         # Initialize validation results
@@ -70,26 +153,29 @@ class DataValidator:
         self.warnings = []
         self.recommendations = []
         
+        # One timestamp per validation, shared by file age, display and the saved report
+        self._report_now = datetime.now()
+        
         try:
             # Step 1: File information
             self.check_file_info(data_path)
             
-            # Step 2: Load and check structure
-            df = self.load_and_check_structure(data_path)
+            # Step 2: Stream file, check structure and build the data profile
+            profile = self.load_and_check_structure(data_path, quick_check)
             
-            if df is not None:
+            if profile is not None:
                 # Step 3: Column analysis
-                self.analyze_columns(df)
+                self.analyze_columns(profile)
                 
                 # Step 4: Data quality checks
-                self.check_data_quality(df, quick_check)
+                self.check_data_quality(profile, quick_check)
                 
                 # Step 5: KPI readiness assessment
-                self.assess_kpi_readiness(df)
+                self.assess_kpi_readiness(profile)
                 
                 # Step 6: Statistical summary (if not quick check)
                 if not quick_check:
-                    self.generate_statistical_summary(df)
+                    self.generate_statistical_summary(profile)
             
             # Step 7: Generate overall assessment
             self.generate_overall_assessment()
@@ -103,24 +189,25 @@ class DataValidator:
             })
             self.validation_results['overall_status'] = 'failed'
         
+        self.flush_log()
         return self.validation_results
     
     def check_file_info(self, data_path: Path):
         """Check basic file information"""
-        print("📄 Checking File Information...")
+        self._print("📄 Checking File Information...")
         
         stat = data_path.stat()
         file_info = {
             'name': data_path.name,
             'size_mb': round(stat.st_size / (1024 * 1024), 2),
             'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-            'age_days': round((datetime.now().timestamp() - stat.st_mtime) / (24 * 3600), 1),
+            'age_days': round((self._report_now.timestamp() - stat.st_mtime) / (24 * 3600), 1),
             'extension': data_path.suffix.lower()
         }
         
-        print(f"  📁 File: {file_info['name']}")
-        print(f"  📏 Size: {file_info['size_mb']} MB")
-        print(f"  📅 Modified: {file_info['modified']} ({file_info['age_days']} days ago)")
+        self._print(f"  📁 File: {file_info['name']}")
+        self._print(f"  📏 Size: {file_info['size_mb']} MB")
+        self._print(f"  📅 Modified: {file_info['modified']} ({file_info['age_days']} days ago)")
         
         # Check file extension
         if file_info['extension'] != '.csv':
@@ -158,9 +245,113 @@ class DataValidator:
         
         self.validation_results['file_info'] = file_info
     
-    def load_and_check_structure(self, data_path: Path) -> Optional[pd.DataFrame]:
-        """Load CSV file and check basic structure"""
-        print("🏗️  Checking File Structure...")
+    def sniff_csv_format(self, handle: BinaryIO, sample_bytes: int = 65536) -> Tuple[Optional[str], Optional[str], List[str]]:
+        """Detect encoding, separator and header columns from the file prefix, then rewind the handle"""
+        head = handle.read(sample_bytes)
+        handle.seek(0)
+        
+        # Byte-order marks are authoritative when present
+        if head.startswith(codecs.BOM_UTF8):
+            encoding = 'utf-8-sig'
+        elif head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            encoding = 'utf-16'
+        else:
+            encoding = None
+            for candidate in ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']:
+                try:
+                    # Incremental decode tolerates a multi-byte character cut at the prefix boundary
+                    codecs.getincrementaldecoder(candidate)().decode(head, final=False)
+                    encoding = candidate
+                    break
+                except UnicodeDecodeError:
+                    continue
+        
+        if encoding is None:
+            return None, None, []
+        
+        sample = codecs.getincrementaldecoder(encoding)(errors='replace').decode(head, final=False)
+        try:
+            separator = csv.Sniffer().sniff(sample, delimiters=',;\t|').delimiter
+        except csv.Error:
+            return encoding, None, []
+        
+        # Column names as pandas derives them ("Unnamed: N" for blanks, "X.1" for repeats),
+        # so the checks and read options refer to the columns pandas creates
+        try:
+            columns = list(pd.read_csv(io.StringIO(sample.lstrip('\ufeff')), sep=separator, nrows=0).columns)
+        except (ValueError, csv.Error):
+            columns = []
+        
+        # Require a reasonable number of columns in the header
+        if len(columns) <= 1:
+            return encoding, None, []
+        
+        return encoding, separator, columns
+    
+    def profiled_columns(self, columns: List[str]) -> Optional[List[str]]:
+        """Mapped columns present in the file, in file order; None when nothing is mapped"""
+        mapped_columns = set(self.config.get('column_mappings', {}).values())
+        profiled = [column for column in columns if column in mapped_columns]
+        return profiled or None
+    
+    def inferred_columns(self, columns: List[str]) -> Optional[List[str]]:
+        """Columns that get numeric types inferred per chunk; None means every column"""
+        column_mappings = self.config.get('column_mappings', {})
+        
+        # Nothing mapped in this file: infer everything so the analysis still has data
+        if self.profiled_columns(columns) is None:
+            return None
+        
+        # Numeric fields keep inferred types so non-numeric values are reported, not rejected.
+        # Every other column stays text: dates are parsed per chunk with a format pinned from
+        # the first value, and unmapped columns are only needed for the whole-row checks.
+        numeric_columns = {column_mappings[field] for field in NUMERIC_FIELDS if field in column_mappings}
+        return [column for column in columns if column in numeric_columns]
+    
+    def read_csv_chunks(self, handle: BinaryIO, encoding: Optional[str] = None, separator: Optional[str] = None,
+                        columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """Yield the file as DataFrame chunks of text, using pyarrow's multithreaded parser when installed
+        
+        Every column is read as text, so whole-row checks see the same values whatever types a chunk
+        would infer; profile_chunks converts the numeric columns afterwards.
+        """
+        if not (encoding and separator):
+            with pd.read_csv(handle, chunksize=CHUNK_SIZE, dtype=str) as reader:
+                yield from reader
+            return
+        
+        if pa_csv is None:
+            with pd.read_csv(handle, encoding=encoding, sep=separator, engine='c', low_memory=False,
+                             chunksize=CHUNK_SIZE, dtype=str) as reader:
+                yield from reader
+            return
+        
+        # pyarrow keeps blank and repeated header names as they are; name the columns as pandas does
+        include_columns = list(columns)
+        reader = pa_csv.open_csv(
+            handle,
+            read_options=pa_csv.ReadOptions(encoding=encoding, block_size=ARROW_BLOCK_SIZE,
+                                            skip_rows=1, column_names=include_columns),
+            parse_options=pa_csv.ParseOptions(delimiter=separator, newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=include_columns,
+                column_types={column: pa.string() for column in include_columns},
+                strings_can_be_null=True
+            )
+        )
+        
+        empty = True
+        for batch in reader:
+            empty = False
+            yield batch.to_pandas()
+        
+        # A header-only file yields no batches; still report its columns as present
+        if empty:
+            yield pd.DataFrame(columns=include_columns)
+    
+    def load_and_check_structure(self, data_path: Path, quick_check: bool = False) -> Optional[Dict[str, Any]]:
+        """Stream CSV file in chunks, check basic structure and build the data profile"""
+        self._print("🏗️  Checking File Structure...")
         
         structure_check = {
             'readable': False,
@@ -173,41 +364,47 @@ class DataValidator:
         }
         
         try:
-            # Try to detect encoding and separator
-            encodings_to_try = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-            separators_to_try = [',', ';', '\t', '|']
-            
-            df = None
-            for encoding in encodings_to_try:
-                for separator in separators_to_try:
-                    try:
-                        df_test = pd.read_csv(data_path, encoding=encoding, sep=separator, nrows=5)
-                        if len(df_test.columns) > 1:  # Reasonable number of columns
-                            df = pd.read_csv(data_path, encoding=encoding, sep=separator)
-                            structure_check['encoding'] = encoding
-                            structure_check['separator'] = separator
-                            break
-                    except:
-                        continue
-                if df is not None:
-                    break
+            # Open once: sniff encoding and separator from the prefix, then parse from the same handle.
+            # Large files are parsed from a read-only mmap so the kernel pages them in without an extra copy
+            with open(data_path, 'rb') as handle:
+                if os.name != 'nt' and os.fstat(handle.fileno()).st_size > MEMORY_MAP_MIN_BYTES:
+                    source = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    source = handle
+                
+                with source:
+                    encoding, separator, columns = self.sniff_csv_format(source)
+                    
+                    profile_columns = None
+                    inferred_columns = None
+                    if encoding and separator:
+                        chunks = self.read_csv_chunks(source, encoding, separator, columns)
+                        profile_columns = self.profiled_columns(columns)
+                        inferred_columns = self.inferred_columns(columns)
+                        structure_check['encoding'] = encoding
+                        structure_check['separator'] = separator
+                    else:
+                        # Fallback to basic read
+                        chunks = self.read_csv_chunks(source)
+                        columns = None
+                        structure_check['encoding'] = 'default'
+                        structure_check['separator'] = 'default'
+                    
+                    profile = self.profile_chunks(chunks, quick_check, profile_columns, inferred_columns)
             
-            if df is None:
-                # Fallback to basic read
-                df = pd.read_csv(data_path)
-                structure_check['encoding'] = 'default'
-                structure_check['separator'] = 'default'
+            if columns is None:
+                columns = profile['columns']
             
             structure_check['readable'] = True
-            structure_check['row_count'] = len(df)
-            structure_check['column_count'] = len(df.columns)
-            structure_check['columns'] = list(df.columns)
+            structure_check['row_count'] = profile['row_count']
+            structure_check['column_count'] = len(columns)
+            structure_check['columns'] = columns
             structure_check['has_header'] = True  # Assume header if readable
             
-            print(f"  ✅ File loaded successfully")
-            print(f"  📊 Dimensions: {structure_check['row_count']:,} rows × {structure_check['column_count']} columns")
-            print(f"  🔤 Encoding: {structure_check['encoding']}")
-            print(f"  ➖ Separator: '{structure_check['separator']}'")
+            self._print(f"  ✅ File loaded successfully")
+            self._print(f"  📊 Dimensions: {structure_check['row_count']:,} rows × {structure_check['column_count']} columns")
+            self._print(f"  🔤 Encoding: {structure_check['encoding']}")
+            self._print(f"  ➖ Separator: '{structure_check['separator']}'")
             
             # Check for reasonable dimensions
             if structure_check['row_count'] < 10:
@@ -241,17 +438,127 @@ class DataValidator:
                 'message': f"Cannot read CSV file: {e}",
                 'recommendation': 'Check file format, encoding, and separators'
             })
-            df = None
+            profile = None
         
         self.validation_results['structure_check'] = structure_check
-        return df
+        return profile
     
-    def analyze_columns(self, df: pd.DataFrame):
+    def profile_chunks(self, chunks: Iterable[pd.DataFrame], quick_check: bool = False,
+                       profile_columns: Optional[List[str]] = None,
+                       inferred_columns: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Fold text CSV chunks into running accumulators so memory is bounded by the chunk size
+        
+        Null, empty-row and duplicate counts cover every column; when profile_columns is given,
+        the type and field checks only see those columns. inferred_columns are converted to
+        numbers where possible (None: every column), as read_csv's type inference would.
+        
+        Duplicate detection keeps one 8-byte hash per distinct row, about 8 MB per million rows.
+        """
+        profile = {
+            'row_count': 0,
+            'columns': [],
+            'dtypes': {},
+            'null_counts': Counter(),
+            'empty_rows': 0,
+            'row_hashes': np.empty(0, dtype=np.uint64),
+            'duplicate_rows': 0,
+            'value_counts': {},
+            'date_formats': {},
+            'fields': {}
+        }
+        column_mappings = self.config.get('column_mappings', {})
+        
+        for chunk in chunks:
+            # Dates parsed by the format check are reused by the summary within the same chunk
+            self._parsed_dates = {}
+            
+            profile['row_count'] += len(chunk)
+            
+            # One null mask per chunk feeds both the per-column and the whole-row counts
+            null_mask = chunk.isna().to_numpy()
+            profile['null_counts'].update(dict(zip(chunk.columns, null_mask.sum(axis=0).tolist())))
+            profile['empty_rows'] += int(null_mask.all(axis=1).sum())
+            
+            # duplicated() cannot see across chunks, so probe one 64-bit hash per row instead, taken
+            # from the text values so it does not depend on the types this chunk would infer:
+            # repeats within the chunk via np.unique, repeats of earlier chunks in the sorted seen array
+            row_hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+            unique_hashes = np.unique(row_hashes)
+            seen = profile['row_hashes']
+            if len(seen):
+                positions = np.searchsorted(seen, unique_hashes).clip(max=len(seen) - 1)
+                new_hashes = unique_hashes[seen[positions] != unique_hashes]
+            else:
+                new_hashes = unique_hashes
+            profile['duplicate_rows'] += len(row_hashes) - len(new_hashes)
+            if len(new_hashes):
+                profile['row_hashes'] = np.union1d(seen, new_hashes)
+            
+            for column in (chunk.columns if inferred_columns is None else inferred_columns):
+                try:
+                    chunk[column] = pd.to_numeric(chunk[column])
+                except (ValueError, TypeError):
+                    pass
+            
+            if profile_columns is not None:
+                chunk = chunk[profile_columns]
+            
+            if not profile['columns']:
+                profile['columns'] = list(chunk.columns)
+                profile['dtypes'] = dict(chunk.dtypes.items())
+            else:
+                # Types are inferred per chunk; widen to what a whole-file read would have produced
+                for column, dtype in chunk.dtypes.items():
+                    seen = profile['dtypes'].get(column)
+                    if seen is None or seen == dtype:
+                        continue
+                    seen_numeric = pd.api.types.is_numeric_dtype(seen)
+                    if seen_numeric and pd.api.types.is_numeric_dtype(dtype):
+                        profile['dtypes'][column] = np.dtype('float64')
+                    elif seen_numeric:
+                        profile['dtypes'][column] = dtype
+                    elif not pd.api.types.is_numeric_dtype(dtype):
+                        profile['dtypes'][column] = np.dtype('object')
+            
+            if not quick_check:
+                # Narrow integer columns for the detailed passes; reported dtypes and row hashes
+                # are taken above so they do not depend on each chunk's value range
+                for column in chunk.select_dtypes(include='integer').columns:
+                    chunk[column] = pd.to_numeric(chunk[column], downcast='integer')
+                
+                # Low-cardinality distribution columns become categoricals, so value_counts
+                # counts integer codes instead of hashing every string. Categories keep first-
+                # appearance order (factorize, not astype) so top-k ties break as before
+                for field in DISTRIBUTION_FIELDS:
+                    column = column_mappings.get(field)
+                    if column in chunk.columns and not isinstance(chunk[column].dtype, pd.CategoricalDtype):
+                        sample = chunk[column].iloc[:CATEGORY_SAMPLE_ROWS]
+                        if len(sample) and sample.nunique(dropna=True) / len(sample) < CATEGORY_MAX_RATIO:
+                            codes, uniques = pd.factorize(chunk[column])
+                            chunk[column] = pd.Categorical.from_codes(codes, uniques)
+                
+                self.accumulate_priority_format(chunk, profile)
+                self.accumulate_date_formats(chunk, profile)
+                self.accumulate_numeric_fields(chunk, profile)
+                self.accumulate_text_fields(chunk, profile)
+                self.accumulate_statistical_summary(chunk, profile)
+        
+        # Columns without values are read as text; report the type a whole-file read infers for them
+        for column in profile['dtypes']:
+            if profile['row_count'] == 0:
+                profile['dtypes'][column] = np.dtype('object')
+            elif profile['null_counts'][column] == profile['row_count']:
+                profile['dtypes'][column] = np.dtype('float64')
+        
+        return profile
+    
+    def analyze_columns(self, profile: Dict[str, Any]):
         """Analyze column structure and mapping"""
-        print("🔍 Analyzing Columns...")
+        self._print("🔍 Analyzing Columns...")
         
+        row_count = profile['row_count']
         column_analysis = {
-            'total_columns': len(df.columns),
+            'total_columns': self.validation_results['structure_check'].get('column_count', len(profile['columns'])),
             'mapped_columns': {},
             'unmapped_columns': [],
             'missing_required': [],
@@ -262,37 +569,44 @@ class DataValidator:
         # Get column mappings from configuration
         column_mappings = self.config.get('column_mappings', {})
         
+        # Null counts of the mapped columns, taken from the profile once and shared with assess_kpi_readiness
+        self._mapped_nulls = {
+            csv_column: int(profile['null_counts'][csv_column])
+            for csv_column in set(column_mappings.values()) if csv_column in profile['columns']
+        }
+        
         # Check which columns are mapped
         mapped_count = 0
         for internal_name, csv_column in column_mappings.items():
-            if csv_column in df.columns:
+            if csv_column in self._mapped_nulls:
+                null_count = self._mapped_nulls[csv_column]
                 column_analysis['mapped_columns'][internal_name] = {
                     'csv_column': csv_column,
                     'present': True,
-                    'null_count': df[csv_column].isnull().sum(),
-                    'null_percentage': round((df[csv_column].isnull().sum() / len(df)) * 100, 1),
-                    'data_type': str(df[csv_column].dtype)
+                    'null_count': null_count,
+                    'null_percentage': round((null_count / row_count) * 100, 1) if row_count else 0.0,
+                    'data_type': str(profile['dtypes'][csv_column])
                 }
                 mapped_count += 1
-                print(f"  ✅ {internal_name:<15} → {csv_column}")
+                self._print(f"  ✅ {internal_name:<15} → {csv_column}")
             else:
                 column_analysis['mapped_columns'][internal_name] = {
                     'csv_column': csv_column,
                     'present': False
                 }
                 column_analysis['missing_required'].append(internal_name)
-                print(f"  ❌ {internal_name:<15} → {csv_column} (MISSING)")
+                self._print(f"  ❌ {internal_name:<15} → {csv_column} (MISSING)")
         
-        # Identify unmapped columns
-        mapped_csv_columns = [info.get('csv_column') for info in column_analysis['mapped_columns'].values()]
-        for col in df.columns:
+        # Identify unmapped columns (from the file header, since only mapped columns are loaded)
+        mapped_csv_columns = {info['csv_column'] for info in column_analysis['mapped_columns'].values() if info.get('csv_column')}
+        for col in self.validation_results['structure_check'].get('columns', profile['columns']):
             if col not in mapped_csv_columns:
                 column_analysis['unmapped_columns'].append(col)
-                print(f"  ➖ {col} (unmapped)")
+                self._print(f"  ➖ {col} (unmapped)")
         
         column_analysis['mapping_coverage'] = round((mapped_count / len(column_mappings)) * 100, 1)
         
-        print(f"  📊 Mapping Coverage: {column_analysis['mapping_coverage']}% ({mapped_count}/{len(column_mappings)})")
+        self._print(f"  📊 Mapping Coverage: {column_analysis['mapping_coverage']}% ({mapped_count}/{len(column_mappings)})")
         
         # Check for critical missing columns
         if column_analysis['missing_required']:
@@ -315,9 +629,9 @@ class DataValidator:
         
         self.validation_results['column_analysis'] = column_analysis
     
-    def check_data_quality(self, df: pd.DataFrame, quick_check: bool = False):
+    def check_data_quality(self, profile: Dict[str, Any], quick_check: bool = False):
         """Check data quality issues"""
-        print("🔍 Checking Data Quality...")
+        self._print("🔍 Checking Data Quality...")
         
         quality_check = {
             'duplicate_rows': 0,
@@ -329,10 +643,10 @@ class DataValidator:
         }
         
         # Check for duplicates
-        duplicate_count = df.duplicated().sum()
+        duplicate_count = profile['duplicate_rows']
         quality_check['duplicate_rows'] = duplicate_count
         if duplicate_count > 0:
-            print(f"  ⚠️  Duplicate rows found: {duplicate_count}")
+            self._print(f"  ⚠️  Duplicate rows found: {duplicate_count}")
             self.warnings.append({
                 'category': 'Data Quality',
                 'severity': 'warning',
@@ -340,13 +654,13 @@ class DataValidator:
                 'recommendation': 'Consider removing duplicates before processing'
             })
         else:
-            print(f"  ✅ No duplicate rows found")
+            self._print(f"  ✅ No duplicate rows found")
         
         # Check for empty rows
-        empty_rows = df.isnull().all(axis=1).sum()
+        empty_rows = profile['empty_rows']
         quality_check['empty_rows'] = empty_rows
         if empty_rows > 0:
-            print(f"  ⚠️  Empty rows found: {empty_rows}")
+            self._print(f"  ⚠️  Empty rows found: {empty_rows}")
             self.warnings.append({
                 'category': 'Data Quality',
                 'severity': 'warning',
@@ -356,139 +670,208 @@ class DataValidator:
         
         if not quick_check:
             # Detailed data type and format checks
-            self.check_priority_format(df, quality_check)
-            self.check_date_formats(df, quality_check)
-            self.check_numeric_fields(df, quality_check)
-            self.check_text_fields(df, quality_check)
+            self.check_priority_format(profile, quality_check)
+            self.check_date_formats(profile, quality_check)
+            self.check_numeric_fields(profile, quality_check)
+            self.check_text_fields(profile, quality_check)
         
         self.validation_results['data_quality'] = quality_check
     
-    def check_priority_format(self, df: pd.DataFrame, quality_check: Dict):
-        """Check priority field format"""
+    def accumulate_priority_format(self, chunk: pd.DataFrame, profile: Dict[str, Any]):
+        """Accumulate priority format counts for one chunk"""
         column_mappings = self.config.get('column_mappings', {})
         priority_column = column_mappings.get('priority')
         
-        if priority_column and priority_column in df.columns:
-            priority_data = df[priority_column].dropna()
-            if len(priority_data) > 0:
-                # Check for consistent priority format
-                sample_values = priority_data.value_counts().head(10)
-                print(f"  🎯 Priority values sample: {dict(sample_values)}")
+        if priority_column and priority_column in chunk.columns:
+            stats = profile['fields'].setdefault('priority', {'non_null': 0, 'numeric_count': 0, 'text_count': 0})
+            priority_data = chunk[priority_column].dropna()
+            
+            # Check if values follow expected patterns (vectorized over the whole chunk)
+            priority_text = priority_data.astype(str)
+            
+            stats['non_null'] += len(priority_data)
+            stats['numeric_count'] += int(priority_text.str.match(_NUM_PAT, na=False).sum())
+            stats['text_count'] += int(priority_text.str.match(_TXT_PAT, na=False).sum())
+    
+    def check_priority_format(self, profile: Dict[str, Any], quality_check: Dict):
+        """Check priority field format"""
+        stats = profile['fields'].get('priority')
+        
+        if stats and stats['non_null'] > 0:
+            # Check for consistent priority format (value counts are shared with the statistical summary)
+            sample_values = dict(profile['value_counts'].get('priority', Counter()).most_common(10))
+            self._print(f"  🎯 Priority values sample: {sample_values}")
+            
+            total_valid = stats['numeric_count'] + stats['text_count']
+            validity_percent = round((total_valid / stats['non_null']) * 100, 1)
+            
+            if validity_percent < 80:
+                quality_check['format_issues'].append({
+                    'field': 'priority',
+                    'issue': f'Inconsistent priority format ({validity_percent}% valid)',
+                    'sample': list(sample_values)[:3]
+                })
+    
+    def pinned_date_format(self, column_name: str, date_data: pd.Series, profile: Dict[str, Any]) -> Optional[str]:
+        """Infer a column's date format from its first parseable value and reuse it for every chunk"""
+        if guess_datetime_format is None:
+            return None
+        
+        date_formats = profile['date_formats']
+        if column_name not in date_formats:
+            for value in date_data.iloc[:100]:
+                date_format = guess_datetime_format(str(value))
+                if date_format:
+                    date_formats[column_name] = date_format
+                    break
+        return date_formats.get(column_name)
+    
+    def accumulate_date_formats(self, chunk: pd.DataFrame, profile: Dict[str, Any]):
+        """Accumulate date parsing counts for one chunk"""
+        column_mappings = self.config.get('column_mappings', {})
+        
+        for field in DATE_FIELDS:
+            column_name = column_mappings.get(field)
+            if column_name and column_name in chunk.columns:
+                stats = profile['fields'].setdefault(field, {'non_null': 0, 'valid': 0, 'sample': [], 'error': None})
+                date_data = chunk[column_name].dropna()
+                stats['non_null'] += len(date_data)
+                if len(stats['sample']) < 3:
+                    stats['sample'].extend(date_data.iloc[:3 - len(stats['sample'])].tolist())
                 
-                # Check if values follow expected patterns
-                numeric_pattern = re.compile(r'^\d+$')
-                text_pattern = re.compile(r'^\d+\s*-\s*\w+', re.IGNORECASE)
+                # Try to parse dates
+                try:
+                    date_format = self.pinned_date_format(column_name, date_data, profile)
+                    parsed_dates = pd.to_datetime(date_data, errors='coerce', format=date_format)
+                    self._parsed_dates[field] = parsed_dates
+                    stats['valid'] += int(parsed_dates.notna().sum())
+                except Exception as e:
+                    stats['error'] = stats['error'] or e
+    
+    def check_date_formats(self, profile: Dict[str, Any], quality_check: Dict):
+        """Check date field formats"""
+        for field in DATE_FIELDS:
+            stats = profile['fields'].get(field)
+            if stats and stats['non_null'] > 0:
+                if stats['error'] is not None:
+                    quality_check['format_issues'].append({
+                        'field': field,
+                        'issue': f"Date format error: {stats['error']}",
+                        'sample': stats['sample']
+                    })
+                    continue
                 
-                numeric_count = sum(1 for val in priority_data if numeric_pattern.match(str(val)))
-                text_count = sum(1 for val in priority_data if text_pattern.match(str(val)))
+                validity_percent = round((stats['valid'] / stats['non_null']) * 100, 1)
                 
-                total_valid = numeric_count + text_count
-                validity_percent = round((total_valid / len(priority_data)) * 100, 1)
+                self._print(f"  📅 {field}: {validity_percent}% valid dates")
                 
-                if validity_percent < 80:
+                if validity_percent < 90:
                     quality_check['format_issues'].append({
-                        'field': 'priority',
-                        'issue': f'Inconsistent priority format ({validity_percent}% valid)',
-                        'sample': list(sample_values.index[:3])
+                        'field': field,
+                        'issue': f'Date parsing issues ({validity_percent}% valid)',
+                        'sample': stats['sample']
                     })
     
-    def check_date_formats(self, df: pd.DataFrame, quality_check: Dict):
-        """Check date field formats"""
+    def accumulate_numeric_fields(self, chunk: pd.DataFrame, profile: Dict[str, Any]):
+        """Accumulate numeric validity counts for one chunk"""
         column_mappings = self.config.get('column_mappings', {})
-        date_fields = ['opened_at', 'resolved_at', 'closed_at']
+        numeric_field = column_mappings.get('reassignment_count')
         
-        for field in date_fields:
-            column_name = column_mappings.get(field)
-            if column_name and column_name in df.columns:
-                date_data = df[column_name].dropna()
-                if len(date_data) > 0:
-                    # Try to parse dates
-                    try:
-                        parsed_dates = pd.to_datetime(date_data, errors='coerce')
-                        valid_dates = parsed_dates.notna().sum()
-                        validity_percent = round((valid_dates / len(date_data)) * 100, 1)
-                        
-                        print(f"  📅 {field}: {validity_percent}% valid dates")
-                        
-                        if validity_percent < 90:
-                            quality_check['format_issues'].append({
-                                'field': field,
-                                'issue': f'Date parsing issues ({validity_percent}% valid)',
-                                'sample': list(date_data.head(3))
-                            })
-                    except Exception as e:
-                        quality_check['format_issues'].append({
-                            'field': field,
-                            'issue': f'Date format error: {e}',
-                            'sample': list(date_data.head(3))
-                        })
-    
-    def check_numeric_fields(self, df: pd.DataFrame, quality_check: Dict):
+        if numeric_field and numeric_field in chunk.columns:
+            stats = profile['fields'].setdefault('reassignment_count', {
+                'non_null': 0, 'valid': 0, 'max': None, 'sample': [], 'error': None
+            })
+            numeric_data = chunk[numeric_field].dropna()
+            stats['non_null'] += len(numeric_data)
+            if len(stats['sample']) < 3:
+                stats['sample'].extend(numeric_data.iloc[:3 - len(stats['sample'])].tolist())
+            
+            try:
+                # Try to convert to numeric
+                numeric_values = pd.to_numeric(numeric_data, errors='coerce')
+                valid_numeric = int(numeric_values.notna().sum())
+                stats['valid'] += valid_numeric
+                if valid_numeric > 0:
+                    chunk_max = numeric_values.max()
+                    stats['max'] = chunk_max if stats['max'] is None else max(stats['max'], chunk_max)
+            except Exception as e:
+                stats['error'] = stats['error'] or e
+    
+    def check_numeric_fields(self, profile: Dict[str, Any], quality_check: Dict):
         """Check numeric field validity"""
-        column_mappings = self.config.get('column_mappings', {})
-        numeric_field = column_mappings.get('reassignment_count')
+        stats = profile['fields'].get('reassignment_count')
         
-        if numeric_field and numeric_field in df.columns:
-            numeric_data = df[numeric_field].dropna()
-            if len(numeric_data) > 0:
-                try:
-                    # Try to convert to numeric
-                    numeric_values = pd.to_numeric(numeric_data, errors='coerce')
-                    valid_numeric = numeric_values.notna().sum()
-                    validity_percent = round((valid_numeric / len(numeric_data)) * 100, 1)
-                    
-                    print(f"  🔢 reassignment_count: {validity_percent}% numeric values")
-                    
-                    if validity_percent < 95:
-                        quality_check['format_issues'].append({
-                            'field': 'reassignment_count',
-                            'issue': f'Non-numeric values found ({validity_percent}% valid)',
-                            'sample': list(numeric_data.head(3))
-                        })
-                    
-                    # Check for reasonable ranges
-                    if valid_numeric > 0:
-                        max_reassignments = numeric_values.max()
-                        if max_reassignments > 20:
-                            quality_check['value_range_issues'].append({
-                                'field': 'reassignment_count',
-                                'issue': f'Unusually high reassignment count: {max_reassignments}',
-                                'recommendation': 'Verify data accuracy'
-                            })
-                
-                except Exception as e:
-                    quality_check['format_issues'].append({
+        if stats and stats['non_null'] > 0:
+            if stats['error'] is not None:
+                quality_check['format_issues'].append({
+                    'field': 'reassignment_count',
+                    'issue': f"Numeric validation error: {stats['error']}",
+                    'sample': stats['sample']
+                })
+                return
+            
+            validity_percent = round((stats['valid'] / stats['non_null']) * 100, 1)
+            
+            self._print(f"  🔢 reassignment_count: {validity_percent}% numeric values")
+            
+            if validity_percent < 95:
+                quality_check['format_issues'].append({
+                    'field': 'reassignment_count',
+                    'issue': f'Non-numeric values found ({validity_percent}% valid)',
+                    'sample': stats['sample']
+                })
+            
+            # Check for reasonable ranges
+            if stats['valid'] > 0:
+                max_reassignments = stats['max']
+                if max_reassignments > 20:
+                    quality_check['value_range_issues'].append({
                         'field': 'reassignment_count',
-                        'issue': f'Numeric validation error: {e}',
-                        'sample': list(numeric_data.head(3))
+                        'issue': f'Unusually high reassignment count: {max_reassignments}',
+                        'recommendation': 'Verify data accuracy'
                     })
     
-    def check_text_fields(self, df: pd.DataFrame, quality_check: Dict):
-        """Check text field quality"""
+    def accumulate_text_fields(self, chunk: pd.DataFrame, profile: Dict[str, Any]):
+        """Accumulate short-text counts for one chunk"""
         column_mappings = self.config.get('column_mappings', {})
-        text_fields = ['short_description', 'description', 'category']
         
-        for field in text_fields:
+        for field in TEXT_FIELDS:
             column_name = column_mappings.get(field)
-            if column_name and column_name in df.columns:
-                text_data = df[column_name].dropna()
-                if len(text_data) > 0:
-                    # Check for very short descriptions
-                    short_descriptions = sum(1 for text in text_data if len(str(text).strip()) < 10)
-                    if short_descriptions > len(text_data) * 0.3:  # More than 30%
-                        quality_check['consistency_issues'].append({
-                            'field': field,
-                            'issue': f'Many very short descriptions ({short_descriptions}/{len(text_data)})',
-                            'recommendation': 'Review description quality'
-                        })
-    
-    def assess_kpi_readiness(self, df: pd.DataFrame):
+            if column_name and column_name in chunk.columns:
+                stats = profile['fields'].setdefault(field, {'non_null': 0, 'short_count': 0})
+                text_data = chunk[column_name].dropna()
+                stats['non_null'] += len(text_data)
+                stats['short_count'] += int((text_data.astype(str).str.strip().str.len() < 10).sum())
+    
+    def check_text_fields(self, profile: Dict[str, Any], quality_check: Dict):
+        """Check text field quality"""
+        for field in TEXT_FIELDS:
+            stats = profile['fields'].get(field)
+            if stats and stats['non_null'] > 0:
+                # Check for very short descriptions
+                short_descriptions = stats['short_count']
+                if short_descriptions > stats['non_null'] * 0.3:  # More than 30%
+                    quality_check['consistency_issues'].append({
+                        'field': field,
+                        'issue': f"Many very short descriptions ({short_descriptions}/{stats['non_null']})",
+                        'recommendation': 'Review description quality'
+                    })
+    
+    def assess_kpi_readiness(self, profile: Dict[str, Any]):
         """Assess readiness for each KPI"""
-        print("🎯 Assessing KPI Readiness...")
+        self._print("🎯 Assessing KPI Readiness...")
         
         kpi_readiness = {}
         kpis_config = self.config.get('kpis', {})
         column_mappings = self.config.get('column_mappings', {})
+        row_count = profile['row_count']
+        
+        # Sufficiency per mapped column, computed once rather than per KPI field
+        sufficiency = {
+            csv_column: round(((row_count - null_count) / row_count) * 100, 1) if row_count else 0.0
+            for csv_column, null_count in self._mapped_nulls.items()
+        }
+        missing_set = set(self.validation_results['column_analysis'].get('missing_required', []))
         
         for kpi_id, kpi_config in kpis_config.items():
             if not kpi_config.get('enabled', True):
@@ -507,16 +890,16 @@ class DataValidator:
             
             # Check field availability
             for field in required_fields:
+                if field in missing_set:
+                    readiness['missing_fields'].append(field)
+                    continue
+                
                 csv_column = column_mappings.get(field)
-                if csv_column and csv_column in df.columns:
-                    # Check data sufficiency
-                    non_null_count = df[csv_column].notna().sum()
-                    sufficiency_percent = round((non_null_count / len(df)) * 100, 1)
-                    
+                if csv_column and csv_column in sufficiency:
                     readiness['available_fields'].append({
                         'field': field,
                         'csv_column': csv_column,
-                        'data_sufficiency': sufficiency_percent
+                        'data_sufficiency': sufficiency[csv_column]
                     })
                 else:
                     readiness['missing_fields'].append(field)
@@ -544,7 +927,7 @@ class DataValidator:
             
             # Print readiness status
             status_icon = "✅" if readiness['ready'] else "❌"
-            print(f"  {status_icon} {kpi_id}: {readiness['field_coverage']}% fields, {readiness['data_sufficiency']} data")
+            self._print(f"  {status_icon} {kpi_id}: {readiness['field_coverage']}% fields, {readiness['data_sufficiency']} data")
             
             kpi_readiness[kpi_id] = readiness
             
@@ -568,12 +951,43 @@ class DataValidator:
         
         self.validation_results['kpi_readiness'] = kpi_readiness
     
-    def generate_statistical_summary(self, df: pd.DataFrame):
+    def accumulate_statistical_summary(self, chunk: pd.DataFrame, profile: Dict[str, Any]):
+        """Accumulate date range and value distributions for one chunk"""
+        column_mappings = self.config.get('column_mappings', {})
+        
+        # Date range analysis
+        opened_column = column_mappings.get('opened_at')
+        if opened_column and opened_column in chunk.columns:
+            date_range = profile.setdefault('date_range', {'earliest': None, 'latest': None, 'valid_dates': 0, 'error': None})
+            try:
+                dates = self._parsed_dates.get('opened_at')
+                if dates is None:
+                    opened_data = chunk[opened_column].dropna()
+                    date_format = self.pinned_date_format(opened_column, opened_data, profile)
+                    dates = pd.to_datetime(opened_data, errors='coerce', format=date_format)
+                dates = dates.dropna()
+                if len(dates) > 0:
+                    chunk_min, chunk_max = dates.min(), dates.max()
+                    date_range['earliest'] = chunk_min if date_range['earliest'] is None else min(date_range['earliest'], chunk_min)
+                    date_range['latest'] = chunk_max if date_range['latest'] is None else max(date_range['latest'], chunk_max)
+                    date_range['valid_dates'] += len(dates)
+            except Exception as e:
+                date_range['error'] = date_range['error'] or e
+        
+        # Priority, category and geographic distributions; ordering is only needed for the
+        # final top-k, which Counter.most_common selects with a heap rather than a full sort
+        for field in DISTRIBUTION_FIELDS:
+            column_name = column_mappings.get(field)
+            if column_name and column_name in chunk.columns:
+                chunk_counts = chunk[column_name].value_counts(sort=False)
+                profile['value_counts'].setdefault(field, Counter()).update(chunk_counts.to_dict())
+    
+    def generate_statistical_summary(self, profile: Dict[str, Any]):
         """Generate statistical summary of the data"""
-        print("📊 Generating Statistical Summary...")
+        self._print("📊 Generating Statistical Summary...")
         
         summary = {
-            'record_count': len(df),
+            'record_count': profile['row_count'],
             'date_range': {},
             'priority_distribution': {},
             'category_distribution': {},
@@ -581,50 +995,43 @@ class DataValidator:
             'processing_metrics': {}
         }
         
-        column_mappings = self.config.get('column_mappings', {})
-        
         # Date range analysis
-        opened_column = column_mappings.get('opened_at')
-        if opened_column and opened_column in df.columns:
-            try:
-                dates = pd.to_datetime(df[opened_column], errors='coerce').dropna()
-                if len(dates) > 0:
-                    summary['date_range'] = {
-                        'earliest': dates.min().strftime('%Y-%m-%d'),
-                        'latest': dates.max().strftime('%Y-%m-%d'),
-                        'span_days': (dates.max() - dates.min()).days,
-                        'valid_dates': len(dates)
-                    }
-                    print(f"  📅 Date range: {summary['date_range']['earliest']} to {summary['date_range']['latest']}")
-            except Exception as e:
-                print(f"  ⚠️  Date range analysis failed: {e}")
+        date_range = profile.get('date_range')
+        if date_range:
+            if date_range['error'] is not None:
+                self._print(f"  ⚠️  Date range analysis failed: {date_range['error']}")
+            elif date_range['valid_dates'] > 0:
+                summary['date_range'] = {
+                    'earliest': date_range['earliest'].strftime('%Y-%m-%d'),
+                    'latest': date_range['latest'].strftime('%Y-%m-%d'),
+                    'span_days': (date_range['latest'] - date_range['earliest']).days,
+                    'valid_dates': date_range['valid_dates']
+                }
+                self._print(f"  📅 Date range: {summary['date_range']['earliest']} to {summary['date_range']['latest']}")
         
         # Priority distribution
-        priority_column = column_mappings.get('priority')
-        if priority_column and priority_column in df.columns:
-            priority_counts = df[priority_column].value_counts().head(10)
+        if 'priority' in profile['value_counts']:
+            priority_counts = profile['value_counts']['priority'].most_common(10)
             summary['priority_distribution'] = dict(priority_counts)
-            print(f"  🎯 Top priorities: {dict(priority_counts.head(3))}")
+            self._print(f"  🎯 Top priorities: {dict(priority_counts[:3])}")
         
         # Category distribution
-        category_column = column_mappings.get('category')
-        if category_column and category_column in df.columns:
-            category_counts = df[category_column].value_counts().head(10)
+        if 'category' in profile['value_counts']:
+            category_counts = profile['value_counts']['category'].most_common(10)
             summary['category_distribution'] = dict(category_counts)
-            print(f"  📂 Top categories: {dict(category_counts.head(3))}")
+            self._print(f"  📂 Top categories: {dict(category_counts[:3])}")
         
         # Geographic distribution
-        country_column = column_mappings.get('country')
-        if country_column and country_column in df.columns:
-            country_counts = df[country_column].value_counts().head(10)
+        if 'country' in profile['value_counts']:
+            country_counts = profile['value_counts']['country'].most_common(10)
             summary['geographic_distribution'] = dict(country_counts)
-            print(f"  🌍 Top countries: {dict(country_counts.head(3))}")
+            self._print(f"  🌍 Top countries: {dict(country_counts[:3])}")
         
         self.validation_results['statistical_summary'] = summary
     
     def generate_overall_assessment(self):
         """Generate overall validation assessment"""
-        print("📋 Generating Overall Assessment...")
+        self._print("📋 Generating Overall Assessment...")
         
         # Count issues by severity
         critical_count = len([issue for issue in self.issues if issue.get('severity') == 'critical'])
@@ -670,129 +1077,173 @@ class DataValidator:
             'processing_recommended': overall_status in ['passed', 'warning']
         }
         
-        print(f"  {status_icon} Overall Status: {overall_status.upper()}")
-        print(f"  📊 Issues: {critical_count} critical, {error_count} errors, {warning_count} warnings")
-        print(f"  🎯 KPI Readiness: {readiness_percent}%")
-        print(f"  🚀 Processing Recommended: {'Yes' if self.validation_results['assessment']['processing_recommended'] else 'No'}")
+        self._print(f"  {status_icon} Overall Status: {overall_status.upper()}")
+        self._print(f"  📊 Issues: {critical_count} critical, {error_count} errors, {warning_count} warnings")
+        self._print(f"  🎯 KPI Readiness: {readiness_percent}%")
+        self._print(f"  🚀 Processing Recommended: {'Yes' if self.validation_results['assessment']['processing_recommended'] else 'No'}")
     
     def display_validation_report(self):
         """Display comprehensive validation report"""
-        print("\n" + "="*80)
-        print("                         DATA VALIDATION REPORT")
-        print("="*80)
+        # Nothing to assemble when there is no usable stdout (e.g. pythonw)
+        if sys.stdout is None or not sys.stdout.writable():
+            return
+        
+        # Lines are collected and written in one call rather than one print per line
+        out = []
+        w = out.append
+        
+        # Bind each report section once
+        now = self._report_now or datetime.now()
+        results = self.validation_results
+        assessment = results.get('assessment') or {}
+        file_info = results.get('file_info') or {}
+        structure = results.get('structure_check') or {}
+        column_analysis = results.get('column_analysis') or {}
+        kpi_readiness = results.get('kpi_readiness') or {}
+        
+        w("\n" + "="*80)
+        w("                         DATA VALIDATION REPORT")
+        w("="*80)
         
-        assessment = self.validation_results.get('assessment', {})
-        print(f"📊 Overall Status: {assessment.get('icon', '❓')} {assessment.get('status', 'unknown').upper()}")
-        print(f"💬 {assessment.get('message', 'No assessment available')}")
-        print(f"📅 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print()
+        w(f"📊 Overall Status: {assessment.get('icon', '❓')} {assessment.get('status', 'unknown').upper()}")
+        w(f"💬 {assessment.get('message', 'No assessment available')}")
+        w(f"📅 Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+        w("")
         
         # File information
-        file_info = self.validation_results.get('file_info', {})
         if file_info:
-            print("📄 FILE INFORMATION")
-            print("-" * 40)
-            print(f"Name: {file_info.get('name', 'Unknown')}")
-            print(f"Size: {file_info.get('size_mb', 0)} MB")
-            print(f"Modified: {file_info.get('modified', 'Unknown')}")
-            print(f"Age: {file_info.get('age_days', 0)} days")
-            print()
+            w("📄 FILE INFORMATION")
+            w("-" * 40)
+            w(f"Name: {file_info.get('name', 'Unknown')}")
+            w(f"Size: {file_info.get('size_mb', 0)} MB")
+            w(f"Modified: {file_info.get('modified', 'Unknown')}")
+            w(f"Age: {file_info.get('age_days', 0)} days")
+            w("")
         
         # Structure check
-        structure = self.validation_results.get('structure_check', {})
         if structure:
-            print("🏗️  STRUCTURE CHECK")
-            print("-" * 40)
-            print(f"Readable: {'✅' if structure.get('readable') else '❌'}")
-            print(f"Rows: {structure.get('row_count', 0):,}")
-            print(f"Columns: {structure.get('column_count', 0)}")
-            print(f"Encoding: {structure.get('encoding', 'Unknown')}")
-            print()
+            w("🏗️  STRUCTURE CHECK")
+            w("-" * 40)
+            w(f"Readable: {'✅' if structure.get('readable') else '❌'}")
+            w(f"Rows: {structure.get('row_count', 0):,}")
+            w(f"Columns: {structure.get('column_count', 0)}")
+            w(f"Encoding: {structure.get('encoding', 'Unknown')}")
+            w("")
         
         # Column analysis
-        column_analysis = self.validation_results.get('column_analysis', {})
         if column_analysis:
-            print("🔍 COLUMN ANALYSIS")
-            print("-" * 40)
-            print(f"Mapping Coverage: {column_analysis.get('mapping_coverage', 0)}%")
-            print(f"Missing Required: {len(column_analysis.get('missing_required', []))}")
-            print(f"Unmapped Columns: {len(column_analysis.get('unmapped_columns', []))}")
-            print()
+            w("🔍 COLUMN ANALYSIS")
+            w("-" * 40)
+            w(f"Mapping Coverage: {column_analysis.get('mapping_coverage', 0)}%")
+            w(f"Missing Required: {len(column_analysis.get('missing_required', []))}")
+            w(f"Unmapped Columns: {len(column_analysis.get('unmapped_columns', []))}")
+            w("")
         
         # KPI readiness
-        kpi_readiness = self.validation_results.get('kpi_readiness', {})
         if kpi_readiness:
-            print("🎯 KPI READINESS")
-            print("-" * 40)
+            w("🎯 KPI READINESS")
+            w("-" * 40)
             for kpi_id, readiness in kpi_readiness.items():
-                status_icon = "✅" if readiness.get('ready') else "❌"
-                coverage = readiness.get('field_coverage', 0)
-                sufficiency = readiness.get('data_sufficiency', 'unknown')
-                print(f"{status_icon} {kpi_id}: {coverage}% fields, {sufficiency} data")
-            print()
+                get = readiness.get
+                w("%s %s: %s%% fields, %s data" % (
+                    "✅" if get('ready') else "❌",
+                    kpi_id,
+                    get('field_coverage', 0),
+                    get('data_sufficiency', 'unknown')
+                ))
+            w("")
         
         # Issues and recommendations
-        all_issues = self.issues + self.warnings
-        if all_issues:
-            print("🚨 ISSUES AND WARNINGS")
-            print("-" * 40)
-            for i, issue in enumerate(all_issues, 1):
+        if self.issues or self.warnings:
+            w("🚨 ISSUES AND WARNINGS")
+            w("-" * 40)
+            for i, issue in enumerate(chain(self.issues, self.warnings), 1):
                 severity = issue.get('severity', 'unknown')
                 category = issue.get('category', 'Unknown')
                 message = issue.get('message', 'No message')
                 
-                severity_icons = {
-                    'critical': '🔴',
-                    'error': '❌',
-                    'warning': '⚠️',
-                    'info': 'ℹ️'
-                }
-                icon = severity_icons.get(severity, '⚪')
+                icon = _SEVERITY_ICONS.get(severity, '⚪')
                 
-                print(f"{i}. {icon} {severity.upper()}: {category}")
-                print(f"   {message}")
+                w(f"{i}. {icon} {severity.upper()}: {category}")
+                w(f"   {message}")
                 if 'recommendation' in issue:
-                    print(f"   💡 {issue['recommendation']}")
-                print()
+                    w(f"   💡 {issue['recommendation']}")
+                w("")
         
         if self.recommendations:
-            print("💡 RECOMMENDATIONS")
-            print("-" * 40)
+            w("💡 RECOMMENDATIONS")
+            w("-" * 40)
             for i, rec in enumerate(self.recommendations, 1):
-                print(f"{i}. {rec.get('message', 'No message')}")
-                print(f"   Action: {rec.get('recommendation', 'No recommendation')}")
-                print()
+                w(f"{i}. {rec.get('message', 'No message')}")
+                w(f"   Action: {rec.get('recommendation', 'No recommendation')}")
+                w("")
+        
+        w("="*80)
+        w("💡 TIP: Address critical and error issues before processing")
+        w("📧 Contact IT Service Management Team for validation support")
+        w("="*80)
         
-        print("="*80)
-        print("💡 TIP: Address critical and error issues before processing")
-        print("📧 Contact IT Service Management Team for validation support")
-        print("="*80)
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
     
-    def save_validation_report(self, output_file: Optional[str] = None):
+    def save_validation_report(self, output_file: Optional[str] = None, quiet: bool = False):
         """Save validation report to file"""
+        now = self._report_now or datetime.now()
         if output_file is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = now.strftime('%Y%m%d_%H%M%S')
             output_file = f"output/validation_report_{timestamp}.json"
         
         # Add issues and recommendations to results
         self.validation_results['issues'] = self.issues
         self.validation_results['warnings'] = self.warnings
         self.validation_results['recommendations'] = self.recommendations
-        self.validation_results['generated_at'] = datetime.now().isoformat()
+        self.validation_results['generated_at'] = now.isoformat()
         
         try:
-            output_path = Path(output_file)
-            output_path.parent.mkdir(exist_ok=True)
+            # Plain os.path calls; accepts a str or an existing Path without building new Path objects
+            output_path = os.fspath(output_file)
+            output_dir = os.path.dirname(output_path)
+            if output_dir and output_dir not in _ENSURED_DIRS:
+                os.makedirs(output_dir, exist_ok=True)
+                _ENSURED_DIRS.add(output_dir)
+            
+            payload = None
+            if orjson is not None:
+                try:
+                    # Non-string keys cover numeric priority codes in the distributions;
+                    # datetimes pass through to default=str so they are written as json.dump writes them
+                    payload = orjson.dumps(
+                        self.validation_results,
+                        default=str,
+                        option=(orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY |
+                                orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+                    )
+                except orjson.JSONEncodeError:  # e.g. integers beyond 64 bits
+                    payload = None
             
-            with open(output_path, 'w') as f:
-                json.dump(self.validation_results, f, indent=2, default=str)
+            if payload is not None:
+                # Unbuffered write of the finished bytes; no second copy in a file buffer
+                fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    view = memoryview(payload)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+            else:
+                with open(output_path, 'w', buffering=REPORT_WRITE_BUFFER) as f:
+                    json.dump(self.validation_results, f, indent=2, default=str)
             
-            print(f"\n💾 Validation report saved to: {output_file}")
+            if not quiet:
+                print(f"\n💾 Validation report saved to: {output_file}")
             return output_file
         except Exception as e:
             print(f"\n⚠️  Could not save validation report: {e}")
             return None
 
+# Set by main() from the parsed arguments; read by the script footer
+_SHOULD_PROMPT = False
+
 def main():
     """Main function for data validation"""
     import argparse
@@ -803,32 +1254,30 @@ def main():
     parser.add_argument('--quick', action='store_true', help='Quick validation (skip detailed checks)')
     parser.add_argument('--output', help='Output file for validation report')
     parser.add_argument('--no-display', action='store_true', help='Skip displaying the report')
+    parser.add_argument('--quiet', action='store_true', help='Suppress step-by-step validation progress')
     
     args = parser.parse_args()
     
+    # Only pause for Enter when the report was shown on an interactive console
+    global _SHOULD_PROMPT
+    _SHOULD_PROMPT = not args.no_display and sys.stdin.isatty() and sys.stdout.isatty()
+    
     try:
         print("🚀 Data Validation Utility for KPI Processing")
         print("=" * 60)
         
-        validator = DataValidator(args.config)
+        validator = DataValidator(args.config, verbose=not args.quiet)
         results = validator.validate_data_file(args.data, args.quick)
         
         if not args.no_display:
             validator.display_validation_report()
         
         # Save report
-        report_file = validator.save_validation_report(args.output)
+        report_file = validator.save_validation_report(args.output, quiet=args.no_display)
         
         # Return appropriate exit code
         overall_status = results.get('overall_status', 'unknown')
-        if overall_status == 'critical':
-            return 2
-        elif overall_status == 'error':
-            return 1
-        elif overall_status == 'warning':
-            return 0
-        else:
-            return 0
+        return _EXIT_CODES.get(overall_status, 0)
             
     except KeyboardInterrupt:
         print("\n\n👋 Validation cancelled!")
@@ -839,6 +1288,6 @@ def main():
 
 if __name__ == "__main__":
     exit_code = main()
-    if '--no-display' not in sys.argv:
+    if _SHOULD_PROMPT:
         input("\nPress Enter to exit...")
     sys.exit(exit_code)
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+JSON Output Helper
+==================
+
+Writes result and state files as indented JSON, with orjson when it is installed
+and the stdlib json module otherwise. Both produce the same document.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is used instead
+    orjson = None
+
+def save_json(data: Any, output_file: Union[str, Path]):
+    """Write data to output_file as indented JSON; values JSON cannot represent are written with str()"""
+    payload = None
+    if orjson is not None:
+        try:
+            # Non-string keys cover numeric codes; datetimes pass through to default=str as json.dump writes them
+            payload = orjson.dumps(
+                data,
+                default=str,
+                option=(orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY |
+                        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+            )
+        except orjson.JSONEncodeError:  # e.g. integers beyond 64 bits
+            payload = None
+    
+    if payload is not None:
+        Path(output_file).write_bytes(payload)
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
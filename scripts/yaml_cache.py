@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+YAML Configuration Cache
+========================
+
+Loads the YAML configuration files used by the KPI scripts. A parse is reused within the
+process while the file's mtime, size and inode are unchanged, and a JSON copy kept in the
+cache directory (<cache>/<name>.json) lets later runs skip the YAML parser.
+"""
+
+import copy
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Tuple, Union
+
+# JSON copies are only written when this directory already exists
+CACHE_DIR = "cache"
+
+# Parsed files kept per process, most recently used last
+MEMORY_CACHE_MAX_ENTRIES = 100
+_memory_cache: "OrderedDict[str, Tuple[Tuple[int, int, int], Any]]" = OrderedDict()
+_memory_cache_lock = threading.Lock()
+
+def load_yaml_cached(path: Union[str, os.PathLike], cache_dir: Union[str, os.PathLike] = CACHE_DIR) -> Any:
+    """Parse a YAML file, reusing an earlier parse while the file is unchanged; returns the caller's own copy"""
+    key = os.path.realpath(path)
+    st = os.stat(key)
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    
+    with _memory_cache_lock:
+        cached = _memory_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            _memory_cache.move_to_end(key)
+            return copy.deepcopy(cached[1])
+    
+    source = [key, st.st_mtime_ns, st.st_size]
+    json_copy = os.path.join(cache_dir, f"{os.path.basename(key)}.json")
+    data = _load_json_copy(json_copy, source)
+    if data is None:
+        # PyYAML is only imported when a file actually has to be parsed; libyaml's loader when built with it
+        import yaml
+        with open(key, 'r') as f:
+            data = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+        _write_json_copy(json_copy, source, data)
+    
+    with _memory_cache_lock:
+        _memory_cache[key] = (signature, data)
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > MEMORY_CACHE_MAX_ENTRIES:
+            _memory_cache.popitem(last=False)
+    return copy.deepcopy(data)
+
+def _load_json_copy(json_copy: str, source: list) -> Any:
+    """Return the data from a JSON copy written for this source [path, mtime_ns, size], else None"""
+    try:
+        with open(json_copy, 'r') as f:
+            payload = json.load(f)
+        if payload['source'] == source:
+            return payload['config']
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+    return None
+
+def _write_json_copy(json_copy: str, source: list, data: Any):
+    """Store parsed YAML as JSON; skipped for data JSON cannot represent exactly (dates, non-string keys, ...)"""
+    cache_dir = os.path.dirname(json_copy)
+    try:
+        if data is None or not os.path.isdir(cache_dir) or json.loads(json.dumps(data)) != data:
+            return
+        # Write to a temporary file and rename it so readers never see a partial copy
+        with tempfile.NamedTemporaryFile('w', dir=cache_dir, suffix='.tmp', delete=False) as f:
+            json.dump({'source': source, 'config': data}, f)
+        try:
+            os.replace(f.name, json_copy)
+        except OSError:
+            os.unlink(f.name)
+    except (OSError, TypeError, ValueError):
+        pass
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests for the chunked data validator profile
+============================================
+
+Run with: python -m pytest -q test_data_validator.py
+"""
+
+import csv
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+
+import data_validator
+
+CONFIG_FILE = str(Path(__file__).parent / "config" / "kpi_config.yaml")
+HEADER = ['number', 'priority', 'state', 'opened_at', 'resolved_at', 'reassignment_count', 'country', 'notes']
+
+def incident_row(i):
+    return [f'INC{i:07d}', f'{i % 4 + 1} - High', 'Closed', f'2025-01-{i % 28 + 1:02d} 09:00:00',
+            f'2025-02-{i % 28 + 1:02d} 17:30:00', str(i % 3), ['UK', 'France', 'Poland'][i % 3], f'note {i % 7}']
+
+def write_csv(path, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        writer.writerows(rows)
+
+@pytest.fixture(params=['pyarrow', 'pandas'])
+def small_chunks(request, monkeypatch):
+    """Stream files in many small chunks, through pyarrow or through pandas' parser"""
+    if request.param == 'pyarrow':
+        if data_validator.pa_csv is None:
+            pytest.skip('pyarrow is not installed')
+        monkeypatch.setattr(data_validator, 'ARROW_BLOCK_SIZE', 16 * 1024)
+    else:
+        monkeypatch.setattr(data_validator, 'pa_csv', None)
+    monkeypatch.setattr(data_validator, 'CHUNK_SIZE', 250)
+    return request.param
+
+def validate(path, quick_check=False):
+    validator = data_validator.DataValidator(CONFIG_FILE, verbose=False)
+    return validator.validate_data_file(str(path), quick_check)
+
+def test_duplicates_across_chunks(tmp_path, small_chunks):
+    rows = [incident_row(i) for i in range(1000)]
+    # A blank count in the first chunk makes that chunk's column float and later chunks int
+    rows[3][5] = ''
+    rows += [list(row) for row in rows[:300]]
+    rows += [incident_row(5000)] * 3
+    path = tmp_path / 'incidents.csv'
+    write_csv(path, rows)
+    
+    results = validate(path, quick_check=True)
+    
+    expected = int(pd.read_csv(path).duplicated().sum())
+    assert expected == 302
+    assert results['data_quality']['duplicate_rows'] == expected
+
+def write_mixed_file(path):
+    """Several chunks of incidents with the problems the validator reports"""
+    rows = [incident_row(i) for i in range(1200)]
+    for i in range(0, 1200, 97):
+        rows[i][1] = 'urgent'             # priority outside the accepted formats
+    for i in range(5, 1200, 131):
+        rows[i][3] = '31/12/2024 08:00'   # date in a second format
+    for i in range(9, 1200, 151):
+        rows[i][5] = ''                   # blank count, so some chunks infer float
+    rows[700][5] = 'many'                 # non-numeric count in one chunk only
+    rows[40][5] = '-2'
+    for row in rows:
+        row[4] = ''                       # resolved_at is empty throughout
+    rows[600:600] = [[''] * len(HEADER)] * 4
+    rows += [list(row) for row in rows[100:160]]
+    write_csv(path, rows)
+
+def comparable(results):
+    """Validation results without the fields that depend on when the file was checked"""
+    results = dict(results)
+    results.pop('file_info')
+    return results
+
+@pytest.mark.parametrize('quick_check', [False, True])
+def test_chunked_profile_matches_single_chunk(tmp_path, small_chunks, quick_check):
+    path = tmp_path / 'incidents.csv'
+    write_mixed_file(path)
+    
+    chunked = validate(path, quick_check)
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(data_validator, 'CHUNK_SIZE', 1_000_000)
+        patch.setattr(data_validator, 'ARROW_BLOCK_SIZE', 64 * 1024 * 1024)
+        single = validate(path, quick_check)
+    
+    assert comparable(chunked) == comparable(single)
+
+def test_profile_matches_whole_file_read(tmp_path, small_chunks):
+    path = tmp_path / 'incidents.csv'
+    write_mixed_file(path)
+    
+    results = validate(path)
+    
+    df = pd.read_csv(path)
+    assert results['structure_check']['row_count'] == len(df)
+    assert results['data_quality']['duplicate_rows'] == int(df.duplicated().sum())
+    assert results['data_quality']['empty_rows'] == int(df.isnull().all(axis=1).sum())
+    for info in results['column_analysis']['mapped_columns'].values():
+        column = info['csv_column']
+        assert info['null_count'] == int(df[column].isnull().sum())
+        assert info['data_type'] == str(df[column].dtype)
+
+def test_blank_and_repeated_header_names_follow_pandas(tmp_path, small_chunks):
+    path = tmp_path / 'incidents.csv'
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER + ['', 'priority'])
+        writer.writerows(row + ['x', '9'] for row in (incident_row(i) for i in range(600)))
+    
+    results = validate(path)
+    
+    expected = list(pd.read_csv(path, nrows=0).columns)
+    assert results['structure_check']['columns'] == expected
+    assert results['structure_check']['row_count'] == 600
+    assert results['column_analysis']['unmapped_columns'] == ['notes', 'Unnamed: 8', 'priority.1']
+    assert results['overall_status'] != 'failed'
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Tests for the final summary file discovery and caches
+=====================================================
+
+Run with: python -m pytest -q test_final_summary.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import final_summary
+
+@pytest.fixture
+def generator(tmp_path):
+    for name in ['config', 'output', 'cache', 'logs']:
+        (tmp_path / name).mkdir()
+    return final_summary.FinalSummaryGenerator(
+        config_dir=str(tmp_path / 'config'), output_dir=str(tmp_path / 'output'),
+        cache_dir=str(tmp_path / 'cache'), logs_dir=str(tmp_path / 'logs')
+    )
+
+def test_scan_matches_suffix_case_like_glob(generator, monkeypatch):
+    for name in ['baseline.json', 'RESULT.JSON', 'notes.txt']:
+        (generator.output_dir / name).write_text('{}', encoding='utf-8')
+    
+    names = sorted(os.path.basename(path) for path in generator._scan(generator.output_dir, '.json'))
+    assert names == sorted(path.name for path in generator.output_dir.glob('*.json'))
+    
+    # Windows folds case in normcase, and its glob matches either case
+    monkeypatch.setattr(os.path, 'normcase', str.lower)
+    names = sorted(os.path.basename(path) for path in generator._scan(generator.output_dir, '.json'))
+    assert names == ['RESULT.JSON', 'baseline.json']
+
+def test_result_cache_is_replaced_whole(generator, monkeypatch):
+    generator._result_cache = {'a.json:1:2': {'overall_score': 71.5}}
+    generator._save_result_cache()
+    assert generator._load_result_cache() == {'a.json:1:2': {'overall_score': 71.5}}
+    
+    def interrupted(src, dst):
+        raise OSError('interrupted')
+    monkeypatch.setattr(os, 'replace', interrupted)
+    generator._result_cache = {'b.json:3:4': {'overall_score': 80.0}}
+    generator._save_result_cache()
+    
+    assert generator._load_result_cache() == {'a.json:1:2': {'overall_score': 71.5}}
+    assert os.listdir(generator.cache_dir) == ['summary_cache.json']
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for the pipeline's in-process script runner and processing worker
+=======================================================================
+
+Run with: python -m pytest -q test_kpi_automation.py
+"""
+
+import os
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+
+import kpi_automation
+
+FAKE_PROCESSOR = textwrap.dedent('''
+    import argparse
+    import json
+    import os
+    import sys
+    import time
+    
+    def main():
+        parser = argparse.ArgumentParser()
+        for option in ('--config', '--mode', '--input', '--output', '--kpi'):
+            parser.add_argument(option)
+        args = parser.parse_args()
+        if args.kpi == 'SLOW':
+            time.sleep(30)
+        with open(args.output, 'w') as f:
+            json.dump({'mode': args.mode, 'pid': os.getpid()}, f)
+        print(f"processed {args.input}")
+        sys.stderr.write("warning: sample data\\n")
+        return 0
+''')
+
+def write_script(path, body):
+    path.write_text(textwrap.dedent(body), encoding='utf-8')
+    return str(path)
+
+@pytest.mark.parametrize('body, returncode, stdout, stderr_part', [
+    ('def main():\n    print("ok")\n', 0, 'ok\n', ''),
+    ('def main():\n    return 3\n', 3, '', ''),
+    ('import sys\ndef main():\n    sys.exit("bad arguments")\n', 1, '', 'bad arguments'),
+    ('def main():\n    raise RuntimeError("boom")\n', 1, '', 'RuntimeError: boom'),
+    ('raise ImportError("missing dependency")\n', 1, '', 'ImportError: missing dependency'),
+])
+def test_run_script_file_reports_like_a_subprocess(tmp_path, body, returncode, stdout, stderr_part):
+    script = write_script(tmp_path / 'script.py', body)
+    
+    result = kpi_automation._run_script_file(script, [script, '--flag'])
+    
+    assert result.args == [script, '--flag']
+    assert result.returncode == returncode
+    assert result.stdout == stdout
+    assert stderr_part in result.stderr
+
+def test_run_script_file_restores_argv_and_logging(tmp_path):
+    import logging
+    
+    script = write_script(tmp_path / 'script.py', '''
+        import logging
+        import sys
+        def main():
+            logging.basicConfig(level=logging.DEBUG)
+            print(sys.argv[1:])
+    ''')
+    root_logger = logging.getLogger()
+    saved_argv, saved_handlers, saved_level = sys.argv, root_logger.handlers[:], root_logger.level
+    
+    result = kpi_automation._run_script_file(script, [script, '--mode', 'baseline'])
+    
+    assert result.stdout == "['--mode', 'baseline']\n"
+    assert sys.argv is saved_argv
+    assert root_logger.handlers == saved_handlers
+    assert root_logger.level == saved_level
+
+def test_changed_script_is_imported_again(tmp_path):
+    script = write_script(tmp_path / 'script.py', 'def main():\n    print("first")\n')
+    assert kpi_automation._run_script_file(script, [script]).stdout == 'first\n'
+    
+    write_script(tmp_path / 'script.py', 'def main():\n    print("second")\n')
+    os.utime(script, ns=(os.stat(script).st_atime_ns, os.stat(script).st_mtime_ns + 1_000_000_000))
+    assert kpi_automation._run_script_file(script, [script]).stdout == 'second\n'
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'output').mkdir()
+    processor = tmp_path / 'scripts' / 'fake_processor.py'
+    processor.parent.mkdir()
+    processor.write_text(FAKE_PROCESSOR, encoding='utf-8')
+    monkeypatch.setattr(kpi_automation, 'PROCESSOR_SCRIPT', str(processor))
+    
+    pipeline = kpi_automation.KPIProcessingPipeline(config_file='config/kpi_config.yaml')
+    yield pipeline
+    pipeline.shutdown_processing_pool()
+
+def test_processing_runs_in_one_spawned_worker(pipeline):
+    first = pipeline.execute_processing('data/input.csv', 'baseline', None, 'output/first.json')
+    second = pipeline.execute_processing('data/input.csv', 'incremental', None, 'output/second.json')
+    
+    assert first['status'] == second['status'] == 'success'
+    assert first['stdout'] == 'processed data/input.csv\n'
+    assert first['stderr'] == 'warning: sample data\n'
+    
+    first_pid = kpi_automation._read_json_file('output/first.json')['pid']
+    second_pid = kpi_automation._read_json_file('output/second.json')['pid']
+    assert first_pid != os.getpid()
+    assert first_pid == second_pid
+
+def test_timed_out_worker_is_replaced(pipeline, monkeypatch):
+    monkeypatch.setattr(kpi_automation, 'PROCESSING_TIMEOUT', 3)
+    
+    with pytest.raises(Exception, match='timed out'):
+        pipeline.execute_processing('data/input.csv', 'targeted', 'SLOW', 'output/slow.json')
+    assert pipeline._processing_pool is None
+    
+    result = pipeline.execute_processing('data/input.csv', 'baseline', None, 'output/after.json')
+    assert result['status'] == 'success'
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tests for the KPI processor data transformation
+===============================================
+
+Run with: python -m pytest -q test_kpi_processor.py
+"""
+
+import csv
+import os
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import kpi_processor
+
+EMEA_HEADER = list(kpi_processor.EMEA_COLUMN_MAPPING)
+EXPECTED_HEADER = list(kpi_processor.EMEA_COLUMN_MAPPING.values())
+
+def write_emea_csv(path, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(EMEA_HEADER)
+        writer.writerows(rows)
+
+def emea_row(i, description='Printer offline'):
+    return [f'INC{i:07d}', '2 - High', '2025-01-06 09:00:00', '', 'Closed', '1', 'UK',
+            'Service Desk', description, 'Hardware', 'Printer']
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run each test from an empty directory, so the transform cache is created under it"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+def transformed_frame(data):
+    return data if isinstance(data, pd.DataFrame) else pd.read_csv(data, dtype=str, keep_default_na=False)
+
+def test_multiline_values_are_renamed(workdir):
+    # Larger than pyarrow's 1 MB read block, so the file is split for parallel parsing
+    rows = [emea_row(i, f'Printer offline\nfloor {i}') for i in range(20000)]
+    write_emea_csv('emea.csv', rows)
+    
+    data = kpi_processor.transform_data_if_needed('emea.csv')
+    
+    assert data != 'emea.csv'
+    df = transformed_frame(data)
+    assert list(df.columns) == EXPECTED_HEADER
+    assert len(df) == 20000
+    assert df['description'].iloc[7] == 'Printer offline\nfloor 7'
+
+def test_rows_pyarrow_rejects_are_loaded_with_pandas(workdir):
+    pytest.importorskip('pyarrow')
+    rows = [emea_row(i) for i in range(5)]
+    rows[2] = rows[2][:3]  # short row: pandas pads it, pyarrow refuses it
+    write_emea_csv('emea.csv', rows)
+    
+    data = kpi_processor.transform_data_if_needed('emea.csv')
+    
+    assert isinstance(data, pd.DataFrame)
+    assert list(data.columns) == EXPECTED_HEADER
+    assert len(data) == 5
+
+def test_dataframe_csv_matches_pandas_writer(tmp_path):
+    df = pd.DataFrame({
+        'Number': ['INC0000001', 'INC0000002', 'INC0000003'],
+        'Created': pd.to_datetime(['2024-01-01 09:00:00', '2024-01-02 10:30:00', None]),
+        'Major': [True, False, True],
+        'Reassignment count': [1.0, None, 3.0],
+        'Short description': ['Printer, 2nd floor', 'VPN "drops"', 'Line one\nline two']
+    })
+    csv_file = tmp_path / 'out.csv'
+    
+    kpi_processor.write_dataframe_csv(df, csv_file)
+    
+    assert csv_file.read_text(encoding='utf-8') == df.to_csv(index=False)
+    reread = pd.read_csv(csv_file, parse_dates=['Created'])
+    pd.testing.assert_frame_equal(reread, df, check_dtype=False)
+
+def cached_copies():
+    return sorted(path.name for path in kpi_processor.TRANSFORM_CACHE_DIR.glob('*.csv'))
+
+def test_transform_cache_miss_then_hit(workdir, monkeypatch, capsys):
+    write_emea_csv('emea.csv', [emea_row(i) for i in range(10)])
+    
+    first = kpi_processor.transform_data_if_needed('emea.csv')
+    assert Path(first).parent == kpi_processor.TRANSFORM_CACHE_DIR
+    assert cached_copies() == [Path(first).name]
+    assert list(transformed_frame(first).columns) == EXPECTED_HEADER
+    
+    def fail(*args):
+        raise AssertionError('the cached copy should be reused')
+    monkeypatch.setattr(kpi_processor, 'rename_csv_columns', fail)
+    capsys.readouterr()
+    
+    assert kpi_processor.transform_data_if_needed('emea.csv') == first
+    assert 'Using cached transformed data' in capsys.readouterr().out
+
+def test_changed_source_replaces_stale_copies(workdir):
+    write_emea_csv('emea.csv', [emea_row(i) for i in range(10)])
+    first = kpi_processor.transform_data_if_needed('emea.csv')
+    
+    cache_dir = kpi_processor.TRANSFORM_CACHE_DIR
+    old_partial = cache_dir / f'{kpi_processor.PARTIAL_PREFIX}old.csv'
+    new_partial = cache_dir / f'{kpi_processor.PARTIAL_PREFIX}new.csv'
+    old_partial.write_text('partial', encoding='utf-8')
+    new_partial.write_text('partial', encoding='utf-8')
+    stale = time.time() - kpi_processor.STALE_PARTIAL_SECONDS - 60
+    os.utime(old_partial, (stale, stale))
+    
+    write_emea_csv('emea.csv', [emea_row(i) for i in range(12)])
+    second = kpi_processor.transform_data_if_needed('emea.csv')
+    
+    assert second != first
+    assert len(transformed_frame(second)) == 12
+    assert not Path(first).exists()
+    assert not old_partial.exists()
+    assert new_partial.exists()
+
+def test_failed_cleanup_keeps_the_written_cache(workdir, monkeypatch, capsys):
+    write_emea_csv('emea.csv', [emea_row(i) for i in range(10)])
+    first = kpi_processor.transform_data_if_needed('emea.csv')
+    write_emea_csv('emea.csv', [emea_row(i) for i in range(12)])
+    
+    real_unlink = os.unlink
+    def locked_unlink(path, *args, **kwargs):
+        if os.path.basename(path) == Path(first).name:
+            raise PermissionError('file is locked')
+        return real_unlink(path, *args, **kwargs)
+    monkeypatch.setattr(os, 'unlink', locked_unlink)
+    capsys.readouterr()
+    
+    second = kpi_processor.transform_data_if_needed('emea.csv')
+    
+    assert isinstance(second, str) and Path(second).exists()
+    assert 'Could not write transformed data' not in capsys.readouterr().out
+    assert Path(first).exists()
+
+def test_unwritable_cache_keeps_data_in_memory(workdir, monkeypatch):
+    Path('blocked').write_text('not a directory', encoding='utf-8')
+    monkeypatch.setattr(kpi_processor, 'TRANSFORM_CACHE_DIR', Path('blocked') / 'transformed')
+    write_emea_csv('emea.csv', [emea_row(i) for i in range(10)])
+    
+    data = kpi_processor.transform_data_if_needed('emea.csv')
+    
+    assert isinstance(data, pd.DataFrame)
+    assert list(data.columns) == EXPECTED_HEADER
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared YAML configuration cache
+=============================================
+
+Run with: python -m pytest -q test_yaml_cache.py
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+
+import yaml_cache
+
+@pytest.fixture(autouse=True)
+def empty_memory_cache(monkeypatch):
+    monkeypatch.setattr(yaml_cache, '_memory_cache', type(yaml_cache._memory_cache)())
+
+def write_config(path, text, mtime_ns):
+    path.write_text(text, encoding='utf-8')
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+def test_json_copy_is_written_and_reused(tmp_path):
+    config = tmp_path / 'kpi_config.yaml'
+    cache_dir = tmp_path / 'cache'
+    cache_dir.mkdir()
+    write_config(config, 'kpis:\n  SM001:\n    enabled: true\n', 1_700_000_000_000_000_000)
+    
+    assert yaml_cache.load_yaml_cached(config, cache_dir) == {'kpis': {'SM001': {'enabled': True}}}
+    payload = json.loads((cache_dir / 'kpi_config.yaml.json').read_text(encoding='utf-8'))
+    assert payload['source'] == [os.path.realpath(config), 1_700_000_000_000_000_000, config.stat().st_size]
+    
+    # A later process reads the JSON copy instead of the YAML
+    yaml_cache._memory_cache.clear()
+    payload['config'] = {'from': 'json copy'}
+    (cache_dir / 'kpi_config.yaml.json').write_text(json.dumps(payload), encoding='utf-8')
+    assert yaml_cache.load_yaml_cached(config, cache_dir) == {'from': 'json copy'}
+
+def test_changed_file_is_parsed_again(tmp_path):
+    config = tmp_path / 'kpi_config.yaml'
+    cache_dir = tmp_path / 'cache'
+    cache_dir.mkdir()
+    write_config(config, 'version: 1\n', 1_700_000_000_000_000_000)
+    assert yaml_cache.load_yaml_cached(config, cache_dir) == {'version': 1}
+    
+    write_config(config, 'version: 2\n', 1_700_000_001_000_000_000)
+    assert yaml_cache.load_yaml_cached(config, cache_dir) == {'version': 2}
+    yaml_cache._memory_cache.clear()
+    assert yaml_cache.load_yaml_cached(config, cache_dir) == {'version': 2}
+
+def test_callers_get_their_own_copy(tmp_path):
+    config = tmp_path / 'kpi_config.yaml'
+    write_config(config, 'kpis:\n  SM001:\n    enabled: true\n', 1_700_000_000_000_000_000)
+    
+    yaml_cache.load_yaml_cached(config, tmp_path / 'cache')['kpis']['SM001']['enabled'] = False
+    assert yaml_cache.load_yaml_cached(config, tmp_path / 'cache') == {'kpis': {'SM001': {'enabled': True}}}
+
+def test_no_json_copy_without_cache_dir_or_for_yaml_only_values(tmp_path):
+    config = tmp_path / 'kpi_config.yaml'
+    write_config(config, 'version: 1\n', 1_700_000_000_000_000_000)
+    yaml_cache.load_yaml_cached(config, tmp_path / 'cache')
+    assert not (tmp_path / 'cache').exists()
+    
+    # Dates do not survive a JSON round trip, so they are only cached in memory
+    (tmp_path / 'cache').mkdir()
+    dated = tmp_path / 'dated.yaml'
+    write_config(dated, 'effective: 2025-01-01\n', 1_700_000_000_000_000_000)
+    assert str(yaml_cache.load_yaml_cached(dated, tmp_path / 'cache')['effective']) == '2025-01-01'
+    assert os.listdir(tmp_path / 'cache') == []
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-q']))